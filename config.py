@@ -1,13 +1,15 @@
-import os
-from dotenv import load_dotenv
+import re
+import sys
+from types import MappingProxyType
+from env_loader import REQUIRED_ENV_VARS, load_env
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (.env is parsed once per process)
+_env = load_env()
 
 # Notion Configuration
-NOTION_TOKEN = os.getenv('NOTION_TOKEN')
-AI_JOBS_DATABASE_ID = os.getenv('AI_JOBS_DATABASE_ID')
-CHANGE_LOG_DATABASE_ID = os.getenv('CHANGE_LOG_DATABASE_ID')
+NOTION_TOKEN = _env['NOTION_TOKEN']
+AI_JOBS_DATABASE_ID = _env['AI_JOBS_DATABASE_ID']
+CHANGE_LOG_DATABASE_ID = _env['CHANGE_LOG_DATABASE_ID']
 
 # API Configuration
 NOTION_API_URL = "https://api.notion.com/v1"
@@ -15,7 +17,13 @@ NOTION_VERSION = "2022-06-28"
 
 # Rate Limiting
 REQUEST_DELAY = 2  # seconds between requests
+HOST_REQUEST_INTERVAL = 2.0  # minimum seconds between page/API fetches to the same host
+HOST_REQUEST_JITTER = 1.0  # up to this many extra random seconds on top
 MAX_RETRIES = 3
+NOTION_RATE_LIMIT = 2.7  # sustained Notion requests per second (API limit is 3)
+NOTION_BURST_SIZE = 3  # requests allowed back-to-back after an idle period
+NOTION_MAX_WORKERS = 3  # concurrent page creations in NotionClient.create_job_entries
+NOTION_WRITE_QUEUE_SIZE = 64  # new jobs buffered for the scraper's Notion writer thread
 
 # Scraping Configuration
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
@@ -84,6 +92,25 @@ JOB_SOURCES = {
     },
 }
 
+
+def _intern(value):
+    """Intern strings and lists of strings so repeated comparisons are pointer checks"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_intern(item) for item in value)
+    return value
+
+
+def _freeze_source(source):
+    """Read-only view of a single source (lists become tuples, strings are interned)"""
+    return MappingProxyType({sys.intern(key): _intern(value) for key, value in source.items()})
+
+
+# Sources are read-only at runtime - edit the dict above or use gui_controller.py
+JOB_SOURCES = MappingProxyType({sys.intern(key): _freeze_source(source)
+                                for key, source in JOB_SOURCES.items()})
+
 # AI Keywords for filtering
 AI_KEYWORDS = [
     'ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning',
@@ -91,12 +118,22 @@ AI_KEYWORDS = [
     'computer vision', 'robotics', 'algorithm', 'model', 'prediction', 
     'analytics', 'intelligence', 'automation', 'optimization', 'recommendation',
     'chatbot', 'gpt', 'transformer', 'bert', 'tensorflow', 'pytorch',
-    'scikit-learn', 'pandas', 'numpy', 'jupyter', 'kaggle'
+    'scikit-learn', 'pandas', 'numpy', 'jupyter', 'kaggle', 'mlops'
 ]
 
+# Single-pass matcher over all AI keywords (longest first, whole words, simple plurals).
+# Word boundaries are ASCII-only: Python's \b counts kana and kanji as word characters,
+# which would hide "AIエンジニア", while "HTML" and "email" must still not match.
+AI_KEYWORDS_RE = re.compile(
+    r"(?<![A-Za-z0-9])(?:" + "|".join(map(re.escape, sorted(AI_KEYWORDS, key=len, reverse=True)))
+    + r")s?(?![A-Za-z0-9])",
+    re.IGNORECASE,
+)
+
 # Chrome Options for Selenium
-CHROME_OPTIONS = [
-    "--headless",
+# JavaScript must stay enabled: the career sites render their listings client-side
+CHROME_OPTIONS = (
+    "--headless=new",
     "--no-sandbox",
     "--disable-dev-shm-usage",
     "--disable-gpu",
@@ -104,20 +141,43 @@ CHROME_OPTIONS = [
     "--disable-blink-features=AutomationControlled",
     "--disable-extensions",
     "--disable-plugins",
-    "--disable-images",
-    "--disable-javascript",
-    f"--user-agent={USER_AGENT}"
-]
+    "--blink-settings=imagesEnabled=false",
+    f"--user-agent={USER_AGENT}",
+)
+# Job cards are read once the DOM is parsed, so don't wait for (or download) subresources
+CHROME_PAGE_LOAD_STRATEGY = "eager"
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+CHROME_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.css", "*.woff", "*.woff2", "*.ttf",
+    "*.mp4", "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+)
 
 # Scraping Limits
 MAX_JOBS_PER_SOURCE = 20
 MAX_JOBS_PER_SEARCH = 10
-PAGE_LOAD_TIMEOUT = 30
-ELEMENT_WAIT_TIMEOUT = 10
+MAX_DESCRIPTION_LENGTH = 2000  # Notion rich_text limit; longer descriptions are cut when scraped
+PAGE_LOAD_TIMEOUT = 15
+ELEMENT_WAIT_TIMEOUT = 6  # seconds to wait for job cards / search boxes on selenium pages
+
+# Jobs confirmed in Notion are remembered between runs for this long
+SEEN_JOBS_FILE = "data/seen_jobs.json"
+SEEN_JOBS_TTL = 7 * 24 * 60 * 60  # seconds
+
+# API and requests-strategy pages are reused from disk for this long (the scraper runs twice
+# a day); older copies are revalidated with If-None-Match / If-Modified-Since
+HTTP_CACHE_DIR = "data/http_cache"
+HTTP_CACHE_TTL = 6 * 60 * 60  # seconds
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # Larger pages are abandoned mid-download
+API_MAX_WORKERS = 8  # API fetches and website analyses run concurrently at the start of a run
 
 # Validation
-if not all([NOTION_TOKEN, AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID]):
+_missing = [name for name in REQUIRED_ENV_VARS if not _env[name]]
+if _missing:
     print("⚠️  Warning: Missing required environment variables")
-    print(f"NOTION_TOKEN: {'✅' if NOTION_TOKEN else '❌'}")
-    print(f"AI_JOBS_DATABASE_ID: {'✅' if AI_JOBS_DATABASE_ID else '❌'}")
-    print(f"CHANGE_LOG_DATABASE_ID: {'✅' if CHANGE_LOG_DATABASE_ID else '❌'}")
\ No newline at end of file
+    for name in REQUIRED_ENV_VARS:
+        print(f"{name}: {'❌' if name in _missing else '✅'}")
\ No newline at end of file
@@ -3,126 +3,154 @@
 Quick debug test for Notion API
 """
 
-import requests
-import json
-import os
-from datetime import datetime
-
-# Get environment variables
-NOTION_TOKEN = os.getenv('NOTION_TOKEN')
-AI_JOBS_DATABASE_ID = os.getenv('AI_JOBS_DATABASE_ID')
-CHANGE_LOG_DATABASE_ID = os.getenv('CHANGE_LOG_DATABASE_ID')
-
-print("🔧 Debug Test for AI Jobs Scraper")
-print(f"📅 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-# Test 1: Check environment variables
-print("\n1️⃣ Checking environment variables...")
-print(f"NOTION_TOKEN: {'✅ Set' if NOTION_TOKEN else '❌ Missing'}")
-print(f"AI_JOBS_DATABASE_ID: {'✅ Set' if AI_JOBS_DATABASE_ID else '❌ Missing'}")
-print(f"CHANGE_LOG_DATABASE_ID: {'✅ Set' if CHANGE_LOG_DATABASE_ID else '❌ Missing'}")
-
-if not all([NOTION_TOKEN, AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID]):
-    print("❌ Missing required environment variables. Exiting.")
-    exit(1)
-
-# Test 2: Check Notion API connection
-print("\n2️⃣ Testing Notion API connection...")
-headers = {
-    'Authorization': f'Bearer {NOTION_TOKEN}',
-    'Notion-Version': '2022-06-28',
-    'Content-Type': 'application/json'
-}
-
-try:
-    response = requests.get('https://api.notion.com/v1/users/me', headers=headers)
-    if response.status_code == 200:
-        user_data = response.json()
-        print(f"✅ Connection successful! User: {user_data.get('name', 'Unknown')}")
-    else:
-        print(f"❌ Connection failed: {response.status_code} - {response.text}")
-        exit(1)
-except Exception as e:
-    print(f"❌ Connection error: {e}")
-    exit(1)
-
-# Test 3: Check database schema
-print("\n3️⃣ Checking database schema...")
-try:
-    db_url = f'https://api.notion.com/v1/databases/{AI_JOBS_DATABASE_ID}'
-    response = requests.get(db_url, headers=headers)
-    
-    if response.status_code == 200:
-        db_data = response.json()
-        properties = db_data.get('properties', {})
-        print("📋 Available database fields:")
-        
-        for prop_name, prop_info in properties.items():
-            prop_type = prop_info.get('type', 'unknown')
-            print(f"   - {prop_name}: {prop_type}")
-    else:
-        print(f"❌ Database access failed: {response.status_code} - {response.text}")
-        exit(1)
-        
-except Exception as e:
-    print(f"❌ Database check error: {e}")
-    exit(1)
-
-# Test 4: Try to create a simple entry
-print("\n4️⃣ Testing simple entry creation...")
-
-# Find the title field (could be "Name", "Job Title", "Title", etc.)
-title_field = None
-for prop_name, prop_info in properties.items():
-    if prop_info.get('type') == 'title':
-        title_field = prop_name
-        break
-
-if not title_field:
-    print("❌ No title field found in database!")
-    exit(1)
-
-print(f"📝 Using title field: {title_field}")
-
-# Create minimal entry
-simple_entry = {
-    "parent": {"database_id": AI_JOBS_DATABASE_ID},
-    "properties": {
-        title_field: {
-            "title": [{"text": {"content": f"Test Job - {datetime.now().strftime('%H:%M:%S')}"}}]
+import sys
+
+
+def main():
+    """Run the Notion debug checks; heavy imports happen here, not at import time"""
+    import requests
+    import json
+    from collections import defaultdict
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from config import (
+        NOTION_TOKEN, AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID,
+        NOTION_API_URL, NOTION_VERSION, MAX_RETRIES,
+    )
+
+    print("🔧 Debug Test for AI Jobs Scraper")
+    print(f"📅 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Test 1: Check environment variables
+    print("\n1️⃣ Checking environment variables...")
+    print(f"NOTION_TOKEN: {'✅ Set' if NOTION_TOKEN else '❌ Missing'}")
+    print(f"AI_JOBS_DATABASE_ID: {'✅ Set' if AI_JOBS_DATABASE_ID else '❌ Missing'}")
+    print(f"CHANGE_LOG_DATABASE_ID: {'✅ Set' if CHANGE_LOG_DATABASE_ID else '❌ Missing'}")
+
+    if not all([NOTION_TOKEN, AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID]):
+        print("❌ Missing required environment variables. Exiting.")
+        return 1
+
+    # Test 2: Check Notion API connection
+    print("\n2️⃣ Testing Notion API connection...")
+    headers = {
+        'Authorization': f'Bearer {NOTION_TOKEN}',
+        'Notion-Version': NOTION_VERSION,
+        'Content-Type': 'application/json'
+    }
+
+    # One keep-alive session so the checks reuse TLS connections. Only GETs are retried:
+    # resending the entry-creation POST could create the test page twice.
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(total=MAX_RETRIES, backoff_factor=0.5, status_forcelist=[429, 502, 503],
+                  allowed_methods=['GET'])
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+
+    # The connection and schema checks are independent - fire both at once
+    db_url = f'{NOTION_API_URL}/databases/{AI_JOBS_DATABASE_ID}'
+    executor = ThreadPoolExecutor(max_workers=2)
+    user_future = executor.submit(session.get, f'{NOTION_API_URL}/users/me')
+    db_future = executor.submit(session.get, db_url)
+    executor.shutdown(wait=False)
+
+    try:
+        response = user_future.result()
+        if response.status_code == 200:
+            user_data = response.json()
+            print(f"✅ Connection successful! User: {user_data.get('name', 'Unknown')}")
+        else:
+            print(f"❌ Connection failed: {response.status_code} - {response.text}")
+            return 1
+    except Exception as e:
+        print(f"❌ Connection error: {e}")
+        return 1
+
+    # Test 3: Check database schema
+    print("\n3️⃣ Checking database schema...")
+    try:
+        response = db_future.result()
+
+        if response.status_code == 200:
+            db_data = response.json()
+            properties = db_data.get('properties', {})
+            print("📋 Available database fields:")
+
+            # Index field names by type while listing them
+            props_by_type = defaultdict(list)
+            for prop_name, prop_info in properties.items():
+                prop_type = prop_info.get('type', 'unknown')
+                props_by_type[prop_type].append(prop_name)
+                print(f"   - {prop_name}: {prop_type}")
+        else:
+            print(f"❌ Database access failed: {response.status_code} - {response.text}")
+            return 1
+
+    except Exception as e:
+        print(f"❌ Database check error: {e}")
+        return 1
+
+    # Test 4: Try to create a simple entry
+    print("\n4️⃣ Testing simple entry creation...")
+
+    # Find the title field (could be "Name", "Job Title", "Title", etc.)
+    title_field = next(iter(props_by_type.get('title', ())), None)
+
+    if not title_field:
+        print("❌ No title field found in database!")
+        return 1
+
+    print(f"📝 Using title field: {title_field}")
+
+    # Create minimal entry
+    simple_entry = {
+        "parent": {"database_id": AI_JOBS_DATABASE_ID},
+        "properties": {
+            title_field: {
+                "title": [{"text": {"content": f"Test Job - {datetime.now().strftime('%H:%M:%S')}"}}]
+            }
         }
     }
-}
-
-print(f"🔍 Attempting to create entry with data: {json.dumps(simple_entry, indent=2)}")
-
-try:
-    create_url = 'https://api.notion.com/v1/pages'
-    response = requests.post(create_url, headers=headers, json=simple_entry)
-    
-    if response.status_code == 200:
-        result = response.json()
-        print(f"✅ SUCCESS! Entry created with ID: {result.get('id')}")
-        print("🎉🎉🎉 Your AI Jobs automation system is working! 🎉🎉🎉")
-        print("\n✅ The system can now:")
-        print("   - Connect to Notion API")
-        print("   - Access your database")
-        print("   - Create new entries")
-        print("   - Run automatically every day at 9:00 and 21:00 JST")
-        print(f"\n📝 Check your database: https://www.notion.so/{AI_JOBS_DATABASE_ID}")
-        print(f"🔗 Your newsletter: https://aijobsjp.beehiiv.com/")
-    else:
-        print(f"❌ Entry creation failed: {response.status_code}")
-        print(f"Response: {response.text}")
-        
-        # Try to parse error for more details
-        try:
-            error_data = response.json()
-            print(f"Error details: {json.dumps(error_data, indent=2)}")
-        except:
-            pass
-        
-except Exception as e:
-    print(f"❌ Entry creation error: {e}")
-
-print(f"\n🔧 Debug test completed at {datetime.now().strftime('%H:%M:%S')}")
+
+    print(f"🔍 Attempting to create entry with data: {json.dumps(simple_entry, indent=2)}")
+
+    try:
+        create_url = f'{NOTION_API_URL}/pages'
+        response = session.post(create_url, json=simple_entry)
+
+        if response.status_code == 200:
+            result = response.json()
+            print(f"✅ SUCCESS! Entry created with ID: {result.get('id')}")
+            print("🎉🎉🎉 Your AI Jobs automation system is working! 🎉🎉🎉")
+            print("\n✅ The system can now:")
+            print("   - Connect to Notion API")
+            print("   - Access your database")
+            print("   - Create new entries")
+            print("   - Run automatically every day at 9:00 and 21:00 JST")
+            print(f"\n📝 Check your database: https://www.notion.so/{AI_JOBS_DATABASE_ID}")
+            print(f"🔗 Your newsletter: https://aijobsjp.beehiiv.com/")
+        else:
+            print(f"❌ Entry creation failed: {response.status_code}")
+
+            # Decode the body once: pretty-print it if it is JSON, raw text otherwise
+            body = response.content
+            try:
+                error_data = json.loads(body)
+            except ValueError:
+                error_data = None
+
+            if error_data is None:
+                print(f"Response: {body.decode('utf-8', 'replace')}")
+            else:
+                print(f"Error details: {json.dumps(error_data, indent=2)}")
+
+    except Exception as e:
+        print(f"❌ Entry creation error: {e}")
+
+    print(f"\n🔧 Debug test completed at {datetime.now().strftime('%H:%M:%S')}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Environment loading for the AI Jobs Scraper
+Parses the .env file once per process, even when config.py is re-executed
+"""
+
+import os
+import sys
+from functools import lru_cache
+from dotenv import dotenv_values, load_dotenv
+
+REQUIRED_ENV_VARS = ('NOTION_TOKEN', 'AI_JOBS_DATABASE_ID', 'CHANGE_LOG_DATABASE_ID')
+FROZEN_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_env_constants.py')
+
+
+@lru_cache(maxsize=1)
+def load_env():
+    """Load the required settings (cached per process)
+
+    Prefers the _env_constants module written by freeze_env() at deploy
+    time, which skips parsing .env entirely. Real environment variables
+    still take precedence over both, as they do with load_dotenv().
+    """
+    try:
+        import _env_constants
+    except ImportError:
+        load_dotenv()
+        return {name: os.getenv(name) for name in REQUIRED_ENV_VARS}
+    return {name: os.getenv(name) or getattr(_env_constants, name, None) for name in REQUIRED_ENV_VARS}
+
+
+def freeze_env(env_file='.env', output_file=FROZEN_ENV_FILE):
+    """Compile .env into a Python constants module; returns the path written"""
+    values = dotenv_values(env_file)
+    lines = ['"""Generated by env_loader.py from .env - contains secrets, do not commit"""', '']
+    lines += [f"{name} = {values.get(name)!r}" for name in REQUIRED_ENV_VARS]
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return output_file
+
+
+if __name__ == "__main__":
+    path = freeze_env(*sys.argv[1:2])
+    print(f"✅ Froze environment into {path}")
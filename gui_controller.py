@@ -6,21 +6,54 @@ A GUI application to manage job scraping sources and configurations.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import ast
 import json
 import os
+import re
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import webbrowser
+from collections import OrderedDict
 from datetime import datetime
 
-# Try to import WebsiteAnalyzer with graceful fallback
-try:
-    from website_analyzer import WebsiteAnalyzer
-    ANALYZER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Warning: WebsiteAnalyzer not available: {e}")
+# WebsiteAnalyzer pulls in requests and bs4: only check that it can be imported here,
+# the import itself happens on the first analysis
+_ANALYZER_DEPS = ('website_analyzer', 'requests', 'bs4')
+_missing_deps = [name for name in _ANALYZER_DEPS if importlib.util.find_spec(name) is None]
+ANALYZER_AVAILABLE = not _missing_deps
+if _missing_deps:
+    print(f"⚠️  Warning: WebsiteAnalyzer not available: missing {', '.join(_missing_deps)}")
     print("   Auto-analysis features will be disabled")
-    ANALYZER_AVAILABLE = False
-    WebsiteAnalyzer = None
+
+# Scraping types offered in the form; 'auto' needs the analyzer
+_DEFAULT_TYPE = 'auto' if ANALYZER_AVAILABLE else 'selenium'
+_TYPE_VALUES = ('auto', 'selenium', 'api', 'requests') if ANALYZER_AVAILABLE else ('selenium', 'api', 'requests')
+
+# Rough shape check for URLs typed into the form (scheme, host, no whitespace)
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+
+
+def _valid_url(url):
+    """Whether url looks like an http(s) URL"""
+    return bool(_URL_RE.match(url))
+
+
+# Edits are written to config.py once they have been quiet for this long
+AUTOSAVE_DELAY_MS = 5000
+
+# How often the Tk loop checks whether a background analysis has finished
+ANALYSIS_POLL_MS = 100
+
+# Source fields that are left out of config.py when empty
+_OPTIONAL_FIELDS = ('url', 'base_url', 'search_terms')
+
+# Most recent website analyses kept in memory, keyed by URL
+ANALYSIS_CACHE_SIZE = 128
+
+# The JOB_SOURCES block in config.py: the dict literal up to the next top-level statement
+_SOURCES_RE = re.compile(r'JOB_SOURCES\s*=\s*({.*?})\s*(?=\n\w|\n#|\nif|\Z)', re.DOTALL)
+_SOURCES_SUB_RE = re.compile(r'JOB_SOURCES\s*=\s*{.*?}(?=\s*\n\w|\s*\n#|\s*\nif|\s*\Z)', re.DOTALL)
 
 class JobScraperGUI:
     def __init__(self, root):
@@ -30,32 +63,66 @@ class JobScraperGUI:
         
         # Load configuration
         self.config_file = "config.py"
+        self.sources_file = "sources.json"  # JSON copy of JOB_SOURCES for fast loading
+        self._config_cache = None  # (stamp, text, JOB_SOURCES span) of config.py as last read/written
         self.sources_data = self.load_sources_config()
+        self._dirty = False
+        self._flush_after_id = None
         
-        # Initialize website analyzer if available
-        if ANALYZER_AVAILABLE:
-            self.analyzer = WebsiteAnalyzer()
-        else:
-            self.analyzer = None
+        # Website analyzer is created on first use (see _get_analyzer)
+        self.analyzer = None
+        # Analyses run off the Tk thread; one worker keeps the analyzer's session single-threaded
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._analysis_cache = OrderedDict()
+        self._analysis_poll_id = None
         
         # Create main interface
+        self._tree_rows = {}  # company key -> values currently shown in the tree
+        self._shown_source = None  # (company key, field snapshot) currently filled into the form
         self.create_widgets()
         self.refresh_sources_list()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
     def load_sources_config(self):
         """Load job sources from config.py"""
+        sources = self._load_sources_sidecar()
+        if sources is not None:
+            return sources
+        try:
+            return self._import_sources_config()
+        except Exception as e:
+            print(f"⚠️  Could not import {self.config_file} ({e}), falling back to text parsing")
+        return self._parse_sources_config()
+
+    def _load_sources_sidecar(self):
+        """Sources from sources.json, or None if it is missing, unreadable or older than config.py"""
+        try:
+            if os.path.getmtime(self.sources_file) < os.path.getmtime(self.config_file):
+                return None  # config.py was edited by hand since the last save
+            with open(self.sources_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _import_sources_config(self):
+        """Import config.py (bytecode-cached) and return an editable copy of JOB_SOURCES"""
+        spec = importlib.util.spec_from_file_location("config", self.config_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        # config.py freezes sources into read-only views with tuple lists - thaw them for editing
+        return {key: {field: list(value) if isinstance(value, tuple) else value
+                      for field, value in source.items()}
+                for key, source in module.JOB_SOURCES.items()}
+
+    def _parse_sources_config(self):
+        """Extract JOB_SOURCES from the text of config.py"""
         try:
             # Read the config file and extract JOB_SOURCES
             with open(self.config_file, 'r') as f:
                 config_content = f.read()
             
-            # Extract JOB_SOURCES dictionary from config.py
-            import ast
-            import re
-            
             # Find JOB_SOURCES in the file
-            match = re.search(r'JOB_SOURCES\s*=\s*({.*?})\s*(?=\n\w|\n#|\nif|\Z)', 
-                            config_content, re.DOTALL)
+            match = _SOURCES_RE.search(config_content)
             
             if match:
                 sources_str = match.group(1)
@@ -72,48 +139,104 @@ class JobScraperGUI:
     
     def save_sources_config(self):
         """Save job sources back to config.py"""
+        if self._flush_now():
+            messagebox.showinfo("Success", "Configuration saved successfully!")
+
+    def _mark_dirty(self):
+        """Record an unsaved edit and (re)schedule one coalesced save"""
+        self._dirty = True
+        self._cancel_pending_flush()
+        self._flush_after_id = self.root.after(AUTOSAVE_DELAY_MS, self._autosave)
+
+    def _cancel_pending_flush(self):
+        """Drop any scheduled autosave"""
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+
+    def _autosave(self):
+        """Timer callback: write pending edits"""
+        self._flush_after_id = None
+        if self._dirty and self._flush_now():
+            self.status_var.set("Configuration auto-saved")
+
+    def _on_close(self):
+        """Flush pending edits before the window closes"""
+        if self._dirty and not self._flush_now():
+            if not messagebox.askyesno("Unsaved Changes", "Saving failed. Quit anyway and lose your changes?"):
+                return
+        if self._analysis_poll_id is not None:
+            self.root.after_cancel(self._analysis_poll_id)
+            self._analysis_poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _flush_now(self):
+        """Write job sources to config.py; returns True on success"""
+        self._cancel_pending_flush()
         try:
-            # Read the current config file
-            with open(self.config_file, 'r') as f:
-                config_content = f.read()
+            config_content, (start, end) = self._config_text()
             
-            # Format the JOB_SOURCES dictionary
+            # Format the JOB_SOURCES dictionary and splice it over the old one
             sources_str = "JOB_SOURCES = " + self.format_sources_dict()
+            new_content = config_content[:start] + sources_str + config_content[end:]
             
-            # Replace the JOB_SOURCES section
-            import re
-            pattern = r'JOB_SOURCES\s*=\s*{.*?}(?=\s*\n\w|\s*\n#|\s*\nif|\s*\Z)'
-            new_content = re.sub(pattern, sources_str, config_content, flags=re.DOTALL)
-            
-            # Write back to file
-            with open(self.config_file, 'w') as f:
+            # Write to a temporary file and swap it in, so config.py is never half-written
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 f.write(new_content)
-                
-            messagebox.showinfo("Success", "Configuration saved successfully!")
+            os.replace(tmp_file, self.config_file)
+            self._config_cache = (self._config_stamp(), new_content, (start, start + len(sources_str)))
+            
+            # Refresh the JSON sidecar after config.py, so it is never older than what it mirrors
+            tmp_file = self.sources_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.sources_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.sources_file)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config: {str(e)}")
+            return False
+        
+        self._dirty = False
+        return True
+    
+    def _config_stamp(self):
+        """Modification stamp of config.py, used to detect outside edits"""
+        stat = os.stat(self.config_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _config_text(self):
+        """Text of config.py and the span of its JOB_SOURCES literal (re-read only if the file changed)"""
+        stamp = self._config_stamp()
+        if self._config_cache is None or self._config_cache[0] != stamp:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                config_content = f.read()
+            match = _SOURCES_SUB_RE.search(config_content)
+            if not match:
+                raise ValueError(f"Could not find JOB_SOURCES in {self.config_file}")
+            self._config_cache = (stamp, config_content, match.span())
+        return self._config_cache[1:]
     
     def format_sources_dict(self):
         """Format sources dictionary for writing to config.py"""
-        lines = ["{"]
+        return "\n".join(self._iter_source_lines())
+
+    def _iter_source_lines(self):
+        """Yield the lines of the JOB_SOURCES literal"""
+        yield "{"
         for key, value in self.sources_data.items():
-            lines.append(f"    '{key}': {{")
+            yield f"    {key!r}: {{"
             for sub_key, sub_value in value.items():
-                if isinstance(sub_value, str):
-                    lines.append(f"        '{sub_key}': '{sub_value}',")
-                elif isinstance(sub_value, bool):
-                    lines.append(f"        '{sub_key}': {sub_value},")
-                elif isinstance(sub_value, list):
-                    lines.append(f"        '{sub_key}': [")
-                    for item in sub_value:
-                        lines.append(f"            '{item}',")
-                    lines.append("        ],")
+                # repr() already yields valid, correctly quoted literals; only lists get one item per line
+                if isinstance(sub_value, list):
+                    yield f"        {sub_key!r}: ["
+                    yield from (f"            {item!r}," for item in sub_value)
+                    yield "        ],"
                 else:
-                    lines.append(f"        '{sub_key}': {repr(sub_value)},")
-            lines.append("    },")
-        lines.append("}")
-        return "\n".join(lines)
+                    yield f"        {sub_key!r}: {sub_value!r},"
+            yield "    },"
+        yield "}"
     
     def create_widgets(self):
         """Create the main GUI widgets"""
@@ -153,7 +276,8 @@ class JobScraperGUI:
         self.companies_tree.column('Type', width=80)
         
         # Scrollbar for treeview
-        tree_scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.companies_tree.yview)
+        self.tree_scrollbar = tree_scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL,
+                                                             command=self.companies_tree.yview)
         self.companies_tree.configure(yscrollcommand=tree_scrollbar.set)
         
         self.companies_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -191,6 +315,7 @@ class JobScraperGUI:
         
         # Test Analysis button (disabled if analyzer not available)
         self.test_analysis_btn = ttk.Button(right_frame, text="Test Analysis", command=self.test_analysis)
+        self.test_analysis_btn.bind('<Shift-Button-1>', self._force_test_analysis)
         self.test_analysis_btn.grid(row=2, column=3, pady=5, padx=(5, 0))
         if not ANALYZER_AVAILABLE:
             self.test_analysis_btn.config(state=tk.DISABLED)
@@ -198,15 +323,8 @@ class JobScraperGUI:
         # Scraping type
         ttk.Label(right_frame, text="Scraping Type:").grid(row=3, column=0, sticky=tk.W, pady=5)
         self.type_var = tk.StringVar()
-        
-        # Include 'auto' only if analyzer is available
-        if ANALYZER_AVAILABLE:
-            type_values = ['auto', 'selenium', 'api', 'requests']
-        else:
-            type_values = ['selenium', 'api', 'requests']
-            
         self.type_combo = ttk.Combobox(right_frame, textvariable=self.type_var, 
-                                      values=type_values, width=37)
+                                      values=_TYPE_VALUES, width=37)
         self.type_combo.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
         
         # Enabled checkbox
@@ -285,18 +403,30 @@ class JobScraperGUI:
         self.status_label.pack(side=tk.RIGHT)
     
     def refresh_sources_list(self):
-        """Refresh the companies list"""
-        # Clear existing items
-        for item in self.companies_tree.get_children():
-            self.companies_tree.delete(item)
-        
-        # Add companies
-        for key, source in self.sources_data.items():
-            name = source.get('name', key.title())
-            status = "Enabled" if source.get('enabled', False) else "Disabled"
-            source_type = source.get('type', 'selenium')
+        """Refresh the companies list, touching only rows that changed"""
+        # Detach the scrollbar so it is updated once, not after every row
+        self.companies_tree.configure(yscrollcommand='')
+        try:
+            # Remove companies that no longer exist
+            for key in self._tree_rows.keys() - self.sources_data.keys():
+                self.companies_tree.delete(key)
+                del self._tree_rows[key]
             
-            self.companies_tree.insert('', 'end', iid=key, values=(name, status, source_type))
+            # Add new companies and update changed ones
+            for index, (key, source) in enumerate(self.sources_data.items()):
+                name = source.get('name', key.title())
+                status = "Enabled" if source.get('enabled', False) else "Disabled"
+                source_type = source.get('type', 'selenium')
+                values = (name, status, source_type)
+                
+                shown = self._tree_rows.get(key)
+                if shown is None:
+                    self.companies_tree.insert('', index, iid=key, values=values)
+                elif shown != values:
+                    self.companies_tree.item(key, values=values)
+                self._tree_rows[key] = values
+        finally:
+            self.companies_tree.configure(yscrollcommand=self.tree_scrollbar.set)
     
     def on_company_select(self, event):
         """Handle company selection"""
@@ -307,11 +437,18 @@ class JobScraperGUI:
         company_key = selection[0]
         source = self.sources_data.get(company_key, {})
         
+        # Tk re-fires the event on re-clicks; skip refilling a form that already shows this source
+        shown = (company_key, tuple((field, tuple(value) if isinstance(value, list) else value)
+                                    for field, value in source.items()))
+        if shown == self._shown_source:
+            return
+        self._shown_source = shown
+        
         # Fill form with selected company data
         self.company_name_var.set(company_key)
         self.display_name_var.set(source.get('name', ''))
         self.url_var.set(source.get('url', ''))
-        self.type_var.set(source.get('type', 'auto' if ANALYZER_AVAILABLE else 'selenium'))
+        self.type_var.set(source.get('type', _DEFAULT_TYPE))
         self.enabled_var.set(source.get('enabled', False))
         self.base_url_var.set(source.get('base_url', ''))
         
@@ -320,65 +457,75 @@ class JobScraperGUI:
         self.search_terms_text.delete('1.0', tk.END)
         if search_terms:
             self.search_terms_text.insert('1.0', '\n'.join(search_terms))
+        
+        # Show the cached analysis for this URL, if any
+        cached = self._analysis_cache.get(source.get('url', ''))
+        self._set_analysis_text(cached[1] if cached else '')
     
     def clear_form(self):
         """Clear the form"""
+        self._shown_source = None
         self.company_name_var.set('')
         self.display_name_var.set('')
         self.url_var.set('')
-        self.type_var.set('auto' if ANALYZER_AVAILABLE else 'selenium')
+        self.type_var.set(_DEFAULT_TYPE)
         self.enabled_var.set(False)
         self.base_url_var.set('')
         self.search_terms_text.delete('1.0', tk.END)
         
         # Clear analysis results
-        self.analysis_text.config(state=tk.NORMAL)
-        self.analysis_text.delete('1.0', tk.END)
-        self.analysis_text.config(state=tk.DISABLED)
+        self._set_analysis_text('')
         
         # Clear selection
         self.companies_tree.selection_remove(self.companies_tree.selection())
     
+    def _read_form(self):
+        """Read every form field once; returns (company key, source fields)"""
+        company_key = self.company_name_var.get().strip().lower().replace(' ', '_')
+        fields = {
+            'name': self.display_name_var.get().strip(),
+            'enabled': self.enabled_var.get(),
+            'type': self.type_var.get() or _DEFAULT_TYPE,
+            'url': self.url_var.get().strip(),
+            'base_url': self.base_url_var.get().strip(),
+            'search_terms': self._parse_search_terms(self.search_terms_text.get('1.0', tk.END)),
+        }
+        return company_key, fields
+    
+    def _check_form_urls(self, fields):
+        """Report the first filled-in URL field that is malformed; returns True if all are valid"""
+        for key, label in (('url', 'URL'), ('base_url', 'Base URL')):
+            if fields[key] and not _valid_url(fields[key]):
+                messagebox.showerror("Error", f"{label} is not a valid http(s) URL: {fields[key]}")
+                return False
+        return True
+    
     def add_company(self):
         """Add a new company"""
-        company_key = self.company_name_var.get().strip().lower().replace(' ', '_')
-        display_name = self.display_name_var.get().strip()
-        url = self.url_var.get().strip()
+        company_key, fields = self._read_form()
+        display_name = fields['name']
         
         if not company_key or not display_name:
             messagebox.showerror("Error", "Company name and display name are required")
             return
         
+        if not self._check_form_urls(fields):
+            return
+        
         if company_key in self.sources_data:
             messagebox.showerror("Error", "Company already exists")
             return
         
-        # Create new source entry
-        new_source = {
-            'name': display_name,
-            'enabled': self.enabled_var.get(),
-            'type': self.type_var.get() or ('auto' if ANALYZER_AVAILABLE else 'selenium')
-        }
-        
-        if url:
-            new_source['url'] = url
-            
-        base_url = self.base_url_var.get().strip()
-        if base_url:
-            new_source['base_url'] = base_url
-        
-        # Add search terms if provided
-        search_terms_text = self.search_terms_text.get('1.0', tk.END).strip()
-        if search_terms_text:
-            search_terms = [term.strip() for term in search_terms_text.split('\n') if term.strip()]
-            if search_terms:
-                new_source['search_terms'] = search_terms
+        # Create new source entry (optional fields only when filled in)
+        new_source = {key: value for key, value in fields.items()
+                      if value or key not in _OPTIONAL_FIELDS}
         
         # Add to sources data
         self.sources_data[company_key] = new_source
         
         # Refresh list
         self.refresh_sources_list()
+        self._mark_dirty()
         
         # Select the new item
         self.companies_tree.selection_set(company_key)
@@ -393,49 +540,37 @@ class JobScraperGUI:
             return
         
         company_key = selection[0]
-        display_name = self.display_name_var.get().strip()
-        url = self.url_var.get().strip()
+        _, fields = self._read_form()
+        display_name = fields['name']
         
         if not display_name:
             messagebox.showerror("Error", "Display name is required")
             return
         
-        # Update source entry
+        if not self._check_form_urls(fields):
+            return
+        
+        # Update source entry (emptied optional fields are removed)
         source = self.sources_data[company_key]
-        source['name'] = display_name
-        source['enabled'] = self.enabled_var.get()
-        source['type'] = self.type_var.get() or ('auto' if ANALYZER_AVAILABLE else 'selenium')
-        
-        if url:
-            source['url'] = url
-        elif 'url' in source:
-            del source['url']
-            
-        base_url = self.base_url_var.get().strip()
-        if base_url:
-            source['base_url'] = base_url
-        elif 'base_url' in source:
-            del source['base_url']
-        
-        # Update search terms
-        search_terms_text = self.search_terms_text.get('1.0', tk.END).strip()
-        if search_terms_text:
-            search_terms = [term.strip() for term in search_terms_text.split('\n') if term.strip()]
-            if search_terms:
-                source['search_terms'] = search_terms
+        for key, value in fields.items():
+            if value or key not in _OPTIONAL_FIELDS:
+                source[key] = value
             else:
-                source.pop('search_terms', None)
-        else:
-            source.pop('search_terms', None)
+                source.pop(key, None)
         
         # Refresh list
         self.refresh_sources_list()
+        self._mark_dirty()
         
         # Re-select the updated item
         self.companies_tree.selection_set(company_key)
         
         self.status_var.set(f"Updated company: {display_name}")
     
+    def _parse_search_terms(self, raw):
+        """One search term per non-blank line, surrounding whitespace removed"""
+        return [term for term in map(str.strip, raw.splitlines()) if term]
+    
     def delete_company(self):
         """Delete selected company"""
         selection = self.companies_tree.selection()
@@ -449,13 +584,16 @@ class JobScraperGUI:
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {company_name}?"):
             del self.sources_data[company_key]
             self.refresh_sources_list()
+            self._mark_dirty()
             self.clear_form()
             self.status_var.set(f"Deleted company: {company_name}")
     
     def test_url(self):
         """Test the URL by opening it in browser"""
         url = self.url_var.get().strip()
-        if url:
+        if url and not _valid_url(url):
+            messagebox.showerror("Error", f"Not a valid http(s) URL: {url}")
+        elif url:
             try:
                 webbrowser.open(url)
                 self.status_var.set("URL opened in browser")
@@ -464,9 +602,9 @@ class JobScraperGUI:
         else:
             messagebox.showerror("Error", "Please enter a URL to test")
     
-    def test_analysis(self):
-        """Test website analysis for the entered URL"""
-        if not ANALYZER_AVAILABLE or self.analyzer is None:
+    def test_analysis(self, force=False):
+        """Test website analysis for the entered URL (force skips the cache)"""
+        if not ANALYZER_AVAILABLE:
             messagebox.showerror("Analysis Unavailable", 
                                "Website analysis is not available. Please install required dependencies:\n\n"
                                "pip install requests beautifulsoup4\n\n"
@@ -477,60 +615,119 @@ class JobScraperGUI:
         if not url:
             messagebox.showerror("Error", "Please enter a URL to analyze")
             return
+        if not _valid_url(url):
+            messagebox.showerror("Error", f"Not a valid http(s) URL: {url}")
+            return
+        
+        cached = None if force else self._analysis_cache.get(url)
+        if cached is not None:
+            self._analysis_cache.move_to_end(url)
+            analysis, results = cached
+            self._show_analysis(analysis, results)
+            self.status_var.set(f"Analysis loaded from cache - recommended: {analysis['recommended_strategy']} "
+                                "(Shift+click to re-analyze)")
+            return
+        
+        try:
+            analyzer = self._get_analyzer()
+        except ImportError as e:
+            messagebox.showerror("Analysis Unavailable", f"Failed to load the website analyzer: {e}")
+            return
         
         # Show analyzing message
-        self.analysis_text.config(state=tk.NORMAL)
-        self.analysis_text.delete('1.0', tk.END)
-        self.analysis_text.insert('1.0', "🔍 Analyzing website structure...")
-        self.analysis_text.config(state=tk.DISABLED)
-        self.root.update()
+        self._set_analysis_text("🔍 Analyzing website structure...")
         
+        # Run the network-bound analysis in the background; the Tk loop polls for the result,
+        # since Tk must not be called from the worker thread
+        self.test_analysis_btn.config(state=tk.DISABLED)
+        future = self._executor.submit(analyzer.analyze_website, url)
+        self._poll_analysis(url, future)
+
+    def _get_analyzer(self):
+        """Import and create the website analyzer on first use"""
+        if self.analyzer is None:
+            from website_analyzer import WebsiteAnalyzer
+            self.analyzer = WebsiteAnalyzer()
+        return self.analyzer
+
+    def _force_test_analysis(self, event):
+        """Shift+click handler: re-analyze even if the URL is cached"""
+        if not self.test_analysis_btn.instate(['disabled']):
+            self.test_analysis(force=True)
+        return "break"  # stop the normal click from also firing
+
+    def _poll_analysis(self, url, future):
+        """Timer callback: render the analysis once its future is done, else check again later"""
+        if future.done():
+            self._analysis_poll_id = None
+            self._render_analysis(url, future)
+        else:
+            self._analysis_poll_id = self.root.after(ANALYSIS_POLL_MS, self._poll_analysis, url, future)
+
+    def _render_analysis(self, url, future):
+        """Cache and show a finished analysis (runs on the Tk thread)"""
+        self.test_analysis_btn.config(state=tk.NORMAL)
         try:
-            # Perform analysis
-            analysis = self.analyzer.analyze_website(url)
-            
-            # Format results
-            strategy = analysis['recommended_strategy']
-            confidence = analysis['confidence']
-            explanation = self.analyzer.get_strategy_explanation(analysis)
-            
-            # Display detailed results
-            results = f"Strategy: {strategy.upper()}\n"
-            results += f"Confidence: {confidence:.1%}\n\n"
-            results += f"Details:\n"
-            results += f"• API detected: {'Yes' if analysis['api_detected'] else 'No'}\n"
-            results += f"• JavaScript heavy: {'Yes' if analysis['javascript_heavy'] else 'No'}\n"
-            results += f"• SPA detected: {'Yes' if analysis['spa_detected'] else 'No'}\n"
-            results += f"• Anti-bot measures: {'Yes' if analysis['anti_bot_detected'] else 'No'}\n"
-            results += f"• Response time: {analysis['response_time']:.2f}s\n\n"
-            results += f"Explanation:\n{explanation}"
-            
-            # Update analysis text
-            self.analysis_text.config(state=tk.NORMAL)
-            self.analysis_text.delete('1.0', tk.END)
-            self.analysis_text.insert('1.0', results)
-            self.analysis_text.config(state=tk.DISABLED)
-            
-            # Auto-update type if it's currently 'auto'
-            if self.type_var.get() == 'auto':
-                self.type_var.set(strategy)
-                
-            self.status_var.set(f"Analysis completed - recommended: {strategy}")
+            analysis = future.result()
+            results = self._format_analysis(analysis)
+            # Keep the formatted text too, so cache hits and company selection need no re-formatting
+            self._analysis_cache[url] = (analysis, results)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            self._show_analysis(analysis, results)
             
         except Exception as e:
             error_msg = f"Analysis failed: {str(e)}"
-            self.analysis_text.config(state=tk.NORMAL)
-            self.analysis_text.delete('1.0', tk.END)
-            self.analysis_text.insert('1.0', error_msg)
-            self.analysis_text.config(state=tk.DISABLED)
+            self._set_analysis_text(error_msg)
             
             self.status_var.set("Analysis failed")
             messagebox.showerror("Analysis Error", error_msg)
+
+    def _format_analysis(self, analysis):
+        """Format analysis results for the analysis pane"""
+        strategy = analysis['recommended_strategy']
+        confidence = analysis['confidence']
+        explanation = self.analyzer.get_strategy_explanation(analysis)
+        
+        # Display detailed results
+        results = f"Strategy: {strategy.upper()}\n"
+        results += f"Confidence: {confidence:.1%}\n\n"
+        results += f"Details:\n"
+        results += f"• API detected: {'Yes' if analysis['api_detected'] else 'No'}\n"
+        results += f"• JavaScript heavy: {'Yes' if analysis['javascript_heavy'] else 'No'}\n"
+        results += f"• SPA detected: {'Yes' if analysis['spa_detected'] else 'No'}\n"
+        results += f"• Anti-bot measures: {'Yes' if analysis['anti_bot_detected'] else 'No'}\n"
+        results += f"• Response time: {analysis['response_time']:.2f}s\n\n"
+        results += f"Explanation:\n{explanation}"
+        return results
+
+    def _show_analysis(self, analysis, results):
+        """Display formatted analysis results and apply the recommended strategy"""
+        strategy = analysis['recommended_strategy']
+        self._set_analysis_text(results)
+        
+        # Auto-update type if it's currently 'auto'
+        if self.type_var.get() == 'auto':
+            self.type_var.set(strategy)
+            
+        self.status_var.set(f"Analysis completed - recommended: {strategy}")
+    
+    def _set_analysis_text(self, text):
+        """Replace the contents of the read-only analysis pane"""
+        self.analysis_text.config(state=tk.NORMAL)
+        self.analysis_text.delete('1.0', tk.END)
+        self.analysis_text.insert('1.0', text)
+        self.analysis_text.config(state=tk.DISABLED)
     
     def reload_config(self):
         """Reload configuration from file"""
         if messagebox.askyesno("Confirm Reload", "This will discard any unsaved changes. Continue?"):
+            self._cancel_pending_flush()
+            self._dirty = False
             self.sources_data = self.load_sources_config()
+            # The file may order companies differently - rebuild the list from scratch
+            self.companies_tree.delete(*self._tree_rows)
+            self._tree_rows.clear()
             self.refresh_sources_list()
             self.clear_form()
             self.status_var.set(f"Reloaded {len(self.sources_data)} companies from config")
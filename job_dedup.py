@@ -0,0 +1,87 @@
+"""
+Job Deduplication for the AI Jobs Scraper
+Fingerprints jobs by normalized company + title so duplicates are O(1) set lookups
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, Iterable, Optional
+
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+def job_fingerprint(title: str, company: Optional[str]) -> int:
+    """64-bit fingerprint of a job's normalized company and title
+
+    Both are truncated to 100 characters like the stored Notion fields.
+    Case, surrounding whitespace and punctuation are ignored, so
+    "ML Engineer (Tokyo)" and "ml engineer - tokyo" share a fingerprint.
+    """
+    normalized_title = _NON_WORD_RE.sub(' ', title[:100].lower()).strip()
+    key = f"{(company or '')[:100].strip().lower()}|{normalized_title}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+
+class JobDedup:
+    """Tracks fingerprints of jobs already seen
+
+    Jobs confirmed in Notion (added, or found to exist) can be settled; settled
+    fingerprints are what save() persists, so the next run skips them too.
+    """
+
+    def __init__(self, fingerprints: Iterable[int] = ()):
+        self.seen = set(fingerprints)
+        self.settled = {}  # fingerprint -> time the job was confirmed in Notion
+
+    @classmethod
+    def load(cls, path: str, max_age: float) -> 'JobDedup':
+        """Dedup pre-filled with fingerprints settled within the last max_age seconds"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        cutoff = time.time() - max_age
+        fresh = {int(fingerprint): stamp for fingerprint, stamp in stored.items() if stamp >= cutoff}
+        dedup = cls(fresh)
+        dedup.settled = fresh
+        return dedup
+
+    def save(self, path: str) -> None:
+        """Write settled fingerprints to path (atomically, via a temp file)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({str(fingerprint): stamp for fingerprint, stamp in self.settled.items()}, f)
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def __contains__(self, job_data: Dict) -> bool:
+        return job_fingerprint(job_data.get('title', ''), job_data.get('company', '')) in self.seen
+
+    def add(self, job_data: Dict) -> bool:
+        """Record a job; returns False if an equivalent job was already seen"""
+        return self.add_fingerprint(job_fingerprint(job_data.get('title', ''), job_data.get('company', '')))
+
+    def add_fingerprint(self, fingerprint: int) -> bool:
+        """add() for a fingerprint the caller already computed"""
+        if fingerprint in self.seen:
+            return False
+        self.seen.add(fingerprint)
+        return True
+
+    def settle(self, job_data: Dict) -> None:
+        """Record that a job is in Notion, so later runs can skip it"""
+        self.settle_fingerprint(job_fingerprint(job_data.get('title', ''), job_data.get('company', '')))
+
+    def settle_fingerprint(self, fingerprint: int) -> None:
+        """settle() for a fingerprint the caller already computed"""
+        self.seen.add(fingerprint)
+        self.settled[fingerprint] = time.time()
@@ -1,185 +1,366 @@
+import atexit
+import logging
 import requests
 import json
-import time
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from config import *
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import (
+    NOTION_TOKEN, AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID, NOTION_API_URL, NOTION_VERSION,
+    MAX_RETRIES, NOTION_RATE_LIMIT, NOTION_BURST_SIZE, NOTION_MAX_WORKERS, MAX_DESCRIPTION_LENGTH,
+)
+from job_dedup import job_fingerprint
+from rate_limiter import TokenBucket
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+# AI relevance keywords per tier (plain substrings, matched case-insensitively)
+_HIGH_KEYWORDS = ('ai engineer', 'machine learning', 'deep learning', 'artificial intelligence',
+                  'neural network', 'computer vision', 'nlp', 'data scientist', 'ml engineer')
+_MEDIUM_KEYWORDS = ('ai', 'automation', 'algorithm', 'analytics', 'data engineer',
+                    'software engineer', 'python', 'tensorflow', 'pytorch')
+_LOW_KEYWORDS = ('tech', 'engineer', 'developer', 'software', 'programming')
+
+# All tiers as one pattern of zero-width lookaheads, so a single pass tries every keyword
+# at every position and the named group says which tier matched; a higher tier wins when
+# keywords start at the same spot
+_RELEVANCE_RE = re.compile("(?=" + "|".join(
+    f"(?P<{level}>{'|'.join(map(re.escape, keywords))})"
+    for level, keywords in (("High", _HIGH_KEYWORDS), ("Medium", _MEDIUM_KEYWORDS), ("Low", _LOW_KEYWORDS))
+) + ")", re.IGNORECASE)
+_RELEVANCE_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+# Fixed select values shared by every job payload (only ever serialized, never mutated)
+_PENDING_SELECT = {"select": {"name": "Pending"}}
+_ACTIVE_SELECT = {"select": {"name": "Active"}}
+_FULL_TIME_SELECT = {"select": {"name": "Full-time"}}
+_RELEVANCE_SELECTS = {level: {"select": {"name": level}} for level in ("High", "Medium", "Low", "Unknown")}
+
+
+def _flush_logs_at_exit(client_ref):
+    """atexit hook: write change log entries nobody flushed, one at a time
+
+    Executors cannot schedule work during interpreter shutdown, so the entries are
+    posted sequentially. The hook holds a weak reference and never keeps a client alive.
+    """
+    client = client_ref()
+    if client is not None:
+        client.flush_logs(max_workers=1)
 
 class NotionClient:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('headers', 'rate_limiter', 'session', '_schemas', '_property_ids', '_existing_keys',
+                 '_existing_keys_failed', '_pending_logs', '__weakref__')
+    
     def __init__(self):
         self.headers = {
             'Authorization': f'Bearer {NOTION_TOKEN}',
             'Notion-Version': NOTION_VERSION,
             'Content-Type': 'application/json'
         }
-        self.last_request_time = 0
-    
-    def _rate_limit_wait(self):
-        """Simple rate limiting - wait between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < REQUEST_DELAY:
-            sleep_time = REQUEST_DELAY - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        self.rate_limiter = TokenBucket(NOTION_RATE_LIMIT, NOTION_BURST_SIZE)
+        self._schemas = {}  # database id -> {property name: type}, or None if it could not be fetched
+        self._property_ids = {}  # database id -> {property name: property id}
+        self._existing_keys = None  # Hashed (title, company) keys of jobs in the database, see load_existing_keys
+        self._existing_keys_failed = False
+        
+        # Change log entries are queued and written together; flush whatever is left at exit
+        self._pending_logs = []
+        atexit.register(_flush_logs_at_exit, weakref.ref(self))
+        
+        # One keep-alive session, so calls after the first skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # 429s are retried in _make_request, so the pause applies to every thread sharing the limiter.
+        # Gateway errors are retried for GETs only: a POST that creates a page may have succeeded
+        # behind a 502, and resending it would add a duplicate row.
+        retry = Retry(total=MAX_RETRIES, backoff_factor=0.5, status_forcelist=[502, 503],
+                      allowed_methods=['GET'], raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=max(NOTION_MAX_WORKERS, 4),
+                                                   max_retries=retry))
     
     def _make_request(self, method, url, data=None):
         """Make rate-limited request to Notion API"""
-        self._rate_limit_wait()
-        
         try:
-            if method.upper() == 'POST':
-                response = requests.post(url, headers=self.headers, json=data, timeout=30)
-            elif method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, timeout=30)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+            for attempt in range(MAX_RETRIES + 1):
+                # Token bucket: bursts pass, the sustained rate stays under Notion's limit
+                self.rate_limiter.acquire()
+                
+                if method.upper() == 'POST':
+                    # Pre-encoded body (orjson when available); Content-Type is set on the session
+                    response = self.session.post(url, data=json_codec.dumps(data), timeout=30)
+                elif method.upper() == 'GET':
+                    response = self.session.get(url, timeout=30)
+                else:
+                    raise ValueError(f"Unsupported method: {method}")
+                
+                if response.status_code != 429 or attempt == MAX_RETRIES:
+                    break
+                delay = self._retry_after(response, attempt)
+                print(f"⏳ Notion rate limit hit, backing off {delay:.1f}s")
+                self.rate_limiter.pause(delay)
             
             if response.status_code >= 400:
                 print(f"❌ Notion API error {response.status_code}: {response.text}")
                 return None
                 
-            return response.json()
+            # Nothing to decode on 204 / empty bodies
+            if response.status_code == 204 or not response.content:
+                return {}
+            
+            try:
+                return json_codec.loads(response.content)
+            except ValueError as e:
+                print(f"❌ Notion API returned invalid JSON: {e}")
+                return None
         
         except requests.exceptions.RequestException as e:
             print(f"❌ Notion API error: {e}")
             return None
     
+    @staticmethod
+    def _retry_after(response, attempt):
+        """Seconds to wait after a 429: Notion's Retry-After header, else exponential back-off"""
+        try:
+            return max(float(response.headers.get('Retry-After', '')), 0.0)
+        except ValueError:
+            return 0.5 * 2 ** attempt
+    
     def create_job_entry(self, job_data):
         """Create new job entry in Notion database with correct field types"""
-        url = f"{NOTION_API_URL}/pages"
-        
-        # Build properties with correct field types based on database schema
-        properties = {}
-        
-        # Job Title (title field)
-        properties["Job Title"] = {
-            "title": [{"text": {"content": job_data.get('title', 'Unknown Job')[:100]}}]
-        }
-        
-        # Company (select field) - need to provide select option
-        if job_data.get('company'):
-            properties["Company"] = {
-                "select": {"name": job_data['company'][:100]}
-            }
-        
-        # Location (rich_text field)
-        if job_data.get('location'):
-            properties["Location"] = {
-                "rich_text": [{"text": {"content": job_data['location'][:100]}}]
-            }
-        
-        # Job Link (url field)
-        if job_data.get('url'):
-            properties["Job Link"] = {
-                "url": job_data['url'][:2000]
-            }
-        
-        # Description (rich_text field)
-        if job_data.get('description'):
-            properties["Description"] = {
-                "rich_text": [{"text": {"content": job_data['description'][:2000]}}]
-            }
-        
-        # Data Source (select field)
-        if job_data.get('source'):
-            properties["Data Source"] = {
-                "select": {"name": job_data['source'][:100]}
-            }
-        
-        # AI Relevance Level (select field)
-        ai_level = self._calculate_ai_relevance(job_data.get('title', ''), job_data.get('description', ''))
-        properties["AI Relevance Level"] = {
-            "select": {"name": ai_level}
-        }
-        
-        # Newsletter Status (select field)
-        properties["Newsletter Status"] = {
-            "select": {"name": "Pending"}
-        }
-        
-        # Position Type (select field)
-        properties["Position Type"] = {
-            "select": {"name": job_data.get('job_type', 'Full-time')}
-        }
-        
-        # Date Added (date field)
-        properties["Date Added"] = {
-            "date": {"start": datetime.now().isoformat()}
-        }
-        
-        # Date Last Checked (date field)
-        properties["Date Last Checked"] = {
-            "date": {"start": datetime.now().isoformat()}
-        }
-        
-        # Status (select field)
-        properties["Status"] = {
-            "select": {"name": "Active"}
+        return self._post_job(job_data, self._build_job_payload(job_data))
+    
+    def _build_job_payload(self, job_data):
+        """Build the Notion page payload for a job"""
+        title = job_data.get('title') or ''
+        company = job_data.get('company')
+        location = job_data.get('location')
+        url = job_data.get('url')
+        description = job_data.get('description') or ''
+        source = job_data.get('source')
+        job_type = job_data.get('job_type')
+        checked = {"date": {"start": datetime.now().isoformat()}}  # same timestamp for both dates
+        
+        # Fields every job has (property types follow the database schema)
+        properties = {
+            "Job Title": {"title": [{"text": {"content": (title or 'Unknown Job')[:100]}}]},
+            "AI Relevance Level": _RELEVANCE_SELECTS[self._calculate_ai_relevance(title, description)],
+            "Newsletter Status": _PENDING_SELECT,
+            "Position Type": {"select": {"name": job_type}} if job_type else _FULL_TIME_SELECT,
+            "Date Added": checked,
+            "Date Last Checked": checked,
+            "Status": _ACTIVE_SELECT,
         }
         
-        notion_data = {
-            "parent": {"database_id": AI_JOBS_DATABASE_ID},
-            "properties": properties
+        # Optional fields, only when scraped
+        if company:
+            properties["Company"] = {"select": {"name": company[:100]}}
+        if location:
+            properties["Location"] = {"rich_text": [{"text": {"content": location[:100]}}]}
+        if url:
+            properties["Job Link"] = {"url": url[:2000]}
+        if description:
+            properties["Description"] = {"rich_text": [{"text": {"content": description[:MAX_DESCRIPTION_LENGTH]}}]}
+        if source:
+            properties["Data Source"] = {"select": {"name": source[:100]}}
+        
+        return self._page_payload(AI_JOBS_DATABASE_ID, properties, "Job Title")
+    
+    def _page_payload(self, database_id, properties, title_key, children=None):
+        """Page-creation payload for a database, with properties fitted to its schema"""
+        payload = {
+            "parent": {"database_id": database_id},
+            "properties": self._fit_to_schema(database_id, properties, title_key)
         }
-        
-        print(f"🔍 Creating job entry: {job_data.get('title')} at {job_data.get('company')}")
-        
-        result = self._make_request('POST', url, notion_data)
+        if children:
+            payload["children"] = children
+        return payload
+    
+    def _post_page(self, payload):
+        """Create a page from a prebuilt payload; returns the API response or None"""
+        return self._make_request('POST', f"{NOTION_API_URL}/pages", payload)
+    
+    def _post_job(self, job_data, notion_data, fingerprint=None):
+        """Create the page for a prebuilt job payload; returns the page ID or None"""
+        logger.debug("Creating job entry: %s at %s", job_data.get('title'), job_data.get('company'))
+        # Payload dumps only when debug logging is on - never formatted otherwise
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Job payload: %s", json.dumps(notion_data, indent=2, ensure_ascii=False))
+        
+        result = self._post_page(notion_data)
         if result:
-            print(f"✅ Added job: {job_data.get('title')} at {job_data.get('company')}")
+            logger.debug("Added job: %s at %s", job_data.get('title'), job_data.get('company'))
+            if self._existing_keys is not None:
+                if fingerprint is None:
+                    fingerprint = job_fingerprint(job_data.get('title', ''), job_data.get('company'))
+                self._existing_keys.add(fingerprint)
             return result.get('id')
         else:
             print(f"❌ Failed to add job: {job_data.get('title')}")
             return None
     
-    def log_scraping_activity(self, source, jobs_found, jobs_added, status="Success"):
-        """Log scraping activity to change log database"""
-        url = f"{NOTION_API_URL}/pages"
-        
-        # For change log, we need to check the schema of the change log database
-        # For now, use a simple structure
-        log_data = {
-            "parent": {"database_id": CHANGE_LOG_DATABASE_ID},
-            "properties": {
-                # Assuming change log has a title field
-                "Name": {
-                    "title": [{"text": {"content": f"{source} - {datetime.now().strftime('%Y-%m-%d %H:%M')}"}}]
-                }
+    def create_job_entries(self, jobs, max_workers=NOTION_MAX_WORKERS, fingerprints=None):
+        """Create several job entries concurrently; returns page IDs (None on failure) in input order
+        
+        fingerprints, when given, are the jobs' job_fingerprint values in the same order,
+        so they are not recomputed for the duplicate-check keys.
+        """
+        jobs = list(jobs)
+        fingerprints = list(fingerprints) if fingerprints is not None else [None] * len(jobs)
+        # Build every payload first so the workers only do network I/O
+        payloads = [self._build_job_payload(job) for job in jobs]
+        if len(jobs) <= 1:
+            return list(map(self._post_job, jobs, payloads, fingerprints))
+        
+        # The shared token bucket keeps the combined request rate within Notion's limit
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._post_job, jobs, payloads, fingerprints))
+    
+    def log_scraping_activity(self, source, jobs_found, jobs_added, status="Success", breakdown=None):
+        """Queue a scraping activity entry for the change log database (written by flush_logs)
+        
+        breakdown is an optional list of lines (e.g. per-source counts) written as bullets in the
+        entry's page body, so a whole run is logged with a single page creation.
+        """
+        # Fields are typed after the change log's schema (rich_text when it is unknown)
+        schema = self._get_schema(CHANGE_LOG_DATABASE_ID) or {}
+        properties = {
+            "Name": {
+                "title": [{"text": {"content": f"{source} - {datetime.now().strftime('%Y-%m-%d %H:%M')}"}}]
             }
         }
+        for name, value in (("Source", source), ("Jobs Found", jobs_found),
+                            ("Jobs Added", jobs_added), ("Status", status)):
+            properties[name] = self._property_value(schema.get(name, 'rich_text'), value)
+        
+        children = [{
+            "object": "block",
+            "type": "bulleted_list_item",
+            "bulleted_list_item": {"rich_text": [{"type": "text", "text": {"content": line[:2000]}}]}
+        } for line in breakdown or ()]
+        payload = self._page_payload(CHANGE_LOG_DATABASE_ID, properties, "Name", children)
+        self._pending_logs.append((payload, f"{source} - {jobs_found} found, {jobs_added} added"))
+    
+    def flush_logs(self, max_workers=NOTION_MAX_WORKERS):
+        """Write all queued change log entries concurrently; returns how many were written
+        
+        max_workers=1 posts them one by one on the calling thread (used by the exit hook).
+        """
+        pending, self._pending_logs = self._pending_logs, []
+        if not pending:
+            return 0
+        
+        payloads = [payload for payload, _ in pending]
+        if max_workers <= 1 or len(payloads) == 1:
+            results = [self._post_page(payload) for payload in payloads]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._post_page, payloads))
         
-        # Try to add additional fields if they exist
-        try:
-            # Add as rich_text fields for maximum compatibility
-            if hasattr(self, '_change_log_schema'):
-                # Use cached schema if available
-                pass
+        for (_, summary), result in zip(pending, results):
+            if result:
+                print(f"📊 Logged activity: {summary}")
             else:
-                # Add basic fields as rich_text
-                log_data["properties"]["Source"] = {
-                    "rich_text": [{"text": {"content": source}}]
-                }
-                log_data["properties"]["Jobs Found"] = {
-                    "rich_text": [{"text": {"content": str(jobs_found)}}]
-                }
-                log_data["properties"]["Jobs Added"] = {
-                    "rich_text": [{"text": {"content": str(jobs_added)}}]
-                }
-                log_data["properties"]["Status"] = {
-                    "rich_text": [{"text": {"content": status}}]
-                }
-        except Exception as e:
-            print(f"⚠️  Warning: Could not add log fields: {e}")
-        
-        result = self._make_request('POST', url, log_data)
-        if result:
-            print(f"📊 Logged activity: {source} - {jobs_found} found, {jobs_added} added")
-        return result
+                print(f"❌ Failed to log activity: {summary}")
+        return sum(1 for result in results if result)
+    
+    def _get_schema(self, database_id):
+        """Property name -> type for a database, fetched once per client (None if unavailable)
+        
+        A failed fetch is remembered as None too, so payloads fall back to unfiltered
+        properties for the rest of the run instead of re-requesting the schema per job.
+        """
+        if database_id not in self._schemas:
+            result = self._make_request('GET', f"{NOTION_API_URL}/databases/{database_id}")
+            if not result:
+                print(f"⚠️  Could not load the schema of database {database_id}, sending properties unfiltered")
+                self._schemas[database_id] = None
+                return None
+            properties = result.get('properties', {})
+            self._property_ids[database_id] = {name: prop['id'] for name, prop in properties.items() if 'id' in prop}
+            self._schemas[database_id] = {name: prop.get('type') for name, prop in properties.items()}
+        return self._schemas[database_id]
+    
+    def _fit_to_schema(self, database_id, properties, title_key):
+        """Drop properties the database lacks and put the title under its actual title field"""
+        schema = self._get_schema(database_id)
+        if schema is None:
+            return properties  # schema unknown - send everything and let Notion decide
+        
+        fitted = {}
+        title_field = next((name for name, prop_type in schema.items() if prop_type == 'title'), None)
+        if title_key in properties and title_field:
+            fitted[title_field] = properties[title_key]
+        fitted.update((name, value) for name, value in properties.items()
+                      if name in schema and name != title_key)
+        return fitted
+    
+    def _property_value(self, prop_type, value):
+        """Property payload for a plain value, shaped for the given property type"""
+        if prop_type == 'number' and isinstance(value, (int, float)):
+            return {"number": value}
+        if prop_type == 'select':
+            return {"select": {"name": str(value)[:100]}}
+        return {"rich_text": [{"text": {"content": str(value)}}]}
     
-    def check_job_exists(self, job_title, company):
-        """Check if job already exists in database"""
+    def load_existing_keys(self):
+        """Fetch (title, company) keys of every job already in the database, 100 per page
+        
+        Returns the number of keys loaded, or None if the query failed (duplicate
+        checks then fall back to one query per job).
+        """
+        url = f"{NOTION_API_URL}/databases/{AI_JOBS_DATABASE_ID}/query"
+        schema = self._get_schema(AI_JOBS_DATABASE_ID) or {}
+        title_field = next((name for name, prop_type in schema.items() if prop_type == 'title'), "Job Title")
+        
+        # Ask Notion for just the two properties the keys need, not every field of every page
+        # (property IDs come back from the API already URL-encoded)
+        property_ids = self._property_ids.get(AI_JOBS_DATABASE_ID, {})
+        wanted = [property_ids[name] for name in (title_field, 'Company') if name in property_ids]
+        if wanted:
+            url += "?" + "&".join(f"filter_properties={property_id}" for property_id in wanted)
+        
+        keys = set()
+        query_data = {"page_size": 100}
+        while True:
+            result = self._make_request('POST', url, query_data)
+            if result is None:
+                print("⚠️  Could not load existing jobs, checking duplicates one by one")
+                self._existing_keys_failed = True
+                return None
+            for page in result.get('results', []):
+                props = page.get('properties', {})
+                title = ''.join(part.get('plain_text', '') for part in props.get(title_field, {}).get('title', []))
+                company = (props.get('Company', {}).get('select') or {}).get('name', '')
+                keys.add(job_fingerprint(title, company))
+            if not result.get('has_more'):
+                break
+            query_data["start_cursor"] = result['next_cursor']
+        
+        self._existing_keys = keys
+        self._existing_keys_failed = False
+        print(f"📚 Loaded {len(keys)} existing jobs from Notion")
+        return len(keys)
+    
+    def check_job_exists(self, job_title, company, fingerprint=None):
+        """Check if job already exists in database
+        
+        fingerprint is the job's job_fingerprint, when the caller has already computed it.
+        """
+        if self._existing_keys is None and not self._existing_keys_failed:
+            self.load_existing_keys()
+        if self._existing_keys is not None:
+            if fingerprint is None:
+                fingerprint = job_fingerprint(job_title, company)
+            return fingerprint in self._existing_keys
+        return self._query_job_exists(job_title, company)
+    
+    def _query_job_exists(self, job_title, company):
+        """Check for a job with a database query (used when existing keys could not be loaded)"""
         url = f"{NOTION_API_URL}/databases/{AI_JOBS_DATABASE_ID}/query"
         
         query_data = {
@@ -204,32 +385,17 @@ class NotionClient:
     
     def _calculate_ai_relevance(self, title, description):
         """Calculate AI relevance level based on job title and description"""
-        text = f"{title} {description}".lower()
-        
-        high_keywords = ['ai engineer', 'machine learning', 'deep learning', 'artificial intelligence', 
-                        'neural network', 'computer vision', 'nlp', 'data scientist', 'ml engineer']
-        
-        medium_keywords = ['ai', 'automation', 'algorithm', 'analytics', 'data engineer', 
-                          'software engineer', 'python', 'tensorflow', 'pytorch']
-        
-        low_keywords = ['tech', 'engineer', 'developer', 'software', 'programming']
-        
-        # Check for high relevance
-        for keyword in high_keywords:
-            if keyword in text:
-                return "High"
-        
-        # Check for medium relevance  
-        for keyword in medium_keywords:
-            if keyword in text:
-                return "Medium"
-        
-        # Check for low relevance
-        for keyword in low_keywords:
-            if keyword in text:
-                return "Low"
-        
-        return "Unknown"
+        # Walk the title and then the description once each (no joined copy), keeping the
+        # best tier seen; a High hit ends the scan, so it never reaches the description
+        best = "Unknown"
+        for text in (title, description) if description else (title,):
+            for match in _RELEVANCE_RE.finditer(text):
+                level = match.lastgroup
+                if level == "High":
+                    return level
+                if best == "Unknown" or _RELEVANCE_RANK[level] < _RELEVANCE_RANK[best]:
+                    best = level
+        return best
     
     def test_connection(self):
         """Test Notion API connection"""
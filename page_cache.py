@@ -0,0 +1,89 @@
+"""
+Page Cache for the AI Jobs Scraper
+Keeps fetched response bodies on disk, keyed by URL, so reruns within the TTL skip the network
+and stale entries can be revalidated with a conditional GET
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+
+
+class PageCache:
+    """On-disk cache of response bodies keyed by URL
+
+    Each URL is stored as two files named after its SHA-256: the raw body and
+    a small JSON record of when it was fetched plus its ETag / Last-Modified
+    validators. Writes go through a temp file and os.replace, so concurrent
+    fetches of different URLs are safe.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _paths(self, url: str):
+        """Body and metadata paths for a URL"""
+        key = os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return key + '.body', key + '.json'
+
+    def _read_meta(self, url: str) -> Optional[Dict]:
+        """Stored metadata for url, or None"""
+        try:
+            with open(self._paths(url)[1], encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_body(self, url: str) -> Optional[bytes]:
+        """Stored body for url, or None"""
+        try:
+            with open(self._paths(url)[0], 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Atomically replace path with data"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Cached body for url, or None if it is missing or older than the TTL"""
+        meta = self._read_meta(url)
+        if not meta or time.time() - meta.get('fetched_at', 0) > self.ttl:
+            return None
+        return self._read_body(url)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for the stored copy of url (empty if there is none)"""
+        meta = self._read_meta(url) or {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def put(self, url: str, body: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """Store body as the fresh copy of url"""
+        os.makedirs(self.directory, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        meta = {'url': url, 'fetched_at': time.time(), 'etag': etag, 'last_modified': last_modified}
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def refresh(self, url: str) -> Optional[bytes]:
+        """Mark the stored copy of url fresh again (after a 304) and return its body"""
+        meta = self._read_meta(url)
+        body = self._read_body(url)
+        if meta is None or body is None:
+            return None
+        meta['fetched_at'] = time.time()
+        self._write(self._paths(url)[1], json.dumps(meta).encode('utf-8'))
+        return body
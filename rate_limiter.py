@@ -0,0 +1,103 @@
+"""
+Rate Limiting for the AI Jobs Scraper
+Token-bucket limiter that lets short bursts through while holding a long-run rate,
+and a per-host limiter that spaces out requests to the same website
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Token-bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Every
+    request takes one token; when the bucket is empty, acquire() sleeps only
+    as long as it takes for the next token to arrive. Safe to share between
+    threads: each caller reserves its token under a lock and sleeps outside it.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if none is available. Returns seconds slept"""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            # A negative balance is a queue of reserved tokens still to be earned
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` (e.g. after a 429 with Retry-After)"""
+        with self._lock:
+            self._refill()
+            # At most one token left, minus the credit that accrues over the pause,
+            # so the next acquire() waits `seconds` and queued callers wait longer
+            self.tokens = min(self.tokens, 1.0) - seconds * self.rate
+
+
+class PerHostLimiter:
+    """Minimum spacing between requests to the same host
+
+    Each host keeps the time its next request may start; requests to
+    different hosts never wait on each other. Servers can stretch a host's
+    spacing: Retry-After on a 429/503 holds the host back that long, and
+    X-RateLimit-Remaining / X-RateLimit-Reset spread the remaining quota
+    over the rest of the window.
+    """
+
+    def __init__(self, min_interval: float, jitter: float = 0.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_start = {}  # host -> monotonic time its next request may start
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> float:
+        """Wait for host's next slot and reserve the one after it. Returns seconds slept"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval + random.uniform(0, self.jitter)
+        wait = start - now
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def update(self, host: str, status_code: int, headers) -> None:
+        """Push host's next slot back as far as the response's rate-limit headers ask"""
+        delay = self._delay_from_headers(status_code, headers)
+        if delay:
+            with self._lock:
+                not_before = time.monotonic() + delay
+                self._next_start[host] = max(self._next_start.get(host, not_before), not_before)
+
+    @staticmethod
+    def _delay_from_headers(status_code: int, headers) -> float:
+        """Seconds to hold a host back for, or 0"""
+        retry_after = headers.get('Retry-After', '')
+        if status_code in (429, 503) and retry_after.isdigit():
+            return float(retry_after)
+        remaining = headers.get('X-RateLimit-Remaining', '')
+        reset = headers.get('X-RateLimit-Reset', '')
+        if remaining.isdigit() and reset.isdigit():
+            # Reset is either seconds left in the window or an epoch timestamp
+            window = float(reset)
+            if window > 1e9:
+                window -= time.time()
+            return max(window, 0.0) / max(int(remaining), 1)
+        return 0.0
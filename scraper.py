@@ -3,49 +3,351 @@
 AI Jobs Japan Scraper - Real Implementation
 """
 
+import argparse
+import logging
+import os
+import queue
 import requests
 import time
 import re
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from itertools import islice
+from urllib.parse import quote, quote_plus, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# selenium, webdriver-manager and bs4 are imported where they are first used, so
+# runs served from the API and the page cache never pay for loading them
 from config import *
 from notion_client import NotionClient
-from website_analyzer import WebsiteAnalyzer
+from job_dedup import JobDedup, job_fingerprint
+from page_cache import PageCache
+from rate_limiter import PerHostLimiter
+import json_codec
+from website_analyzer import HTML_PARSER, WebsiteAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Bot-check pages served with a 200 (often after a redirect) instead of the requested content
+_BLOCK_URL_MARKERS = ('/sorry/', 'captcha', '/challenge')
+_BLOCK_PAGE_MARKERS = (
+    b'unusual traffic',
+    b'are you a robot',
+    b'verify you are human',
+    b'solve the captcha',
+    b'complete the captcha',
+)
+
+# CSS selectors, tried in order until one matches (built once, not per card)
+# Generic pages (requests + BeautifulSoup)
+_HTML_JOB_SELECTORS = (
+    '.job-card',
+    '.job-listing',
+    '.job-item',
+    '.job-post',
+    '.position-card',
+    '.career-item',
+    '.opening-item',
+    '[data-job]',
+    '[data-position]',
+    '.posting',
+)
+_HTML_TITLE_SELECTORS = ('h1', 'h2', 'h3', 'h4', '.title', '.job-title', '.position-title')
+_HTML_COMPANY_SELECTORS = ('.company', '.company-name', '.employer')
+_HTML_LOCATION_SELECTORS = ('.location', '.job-location', '.city')
+
+# Generic pages (selenium)
+_GENERIC_CARD_SELECTORS = (
+    '.job-card',
+    '.job-listing',
+    '.job-item',
+    '.job-post',
+    '.position-card',
+    '.career-item',
+    '[data-job]',
+)
+_GENERIC_TITLE_SELECTORS = (
+    'h1',
+    'h2',
+    'h3',
+    'h4',
+    '.title',
+    '.job-title',
+    '.position-title',
+    '.posting-title',
+)
+_GENERIC_LOCATION_SELECTORS = ('.location', '.job-location', '.city', '.address')
+
+# LinkedIn
+_LINKEDIN_CARD_SELECTORS = ('.job-search-card', '.job-card-container', '.job-card', '[data-job-id]')
+_LINKEDIN_TITLE_SELECTORS = (
+    '.job-search-card__title',
+    '.job-card-list__title',
+    'h3',
+    '[data-test-job-card-list__title]',
+)
+_LINKEDIN_COMPANY_SELECTORS = (
+    '.job-search-card__subtitle',
+    '.job-card-container__company-name',
+    '.job-card-container__subtitle',
+)
+_LINKEDIN_LOCATION_SELECTORS = ('.job-search-card__location', '.job-card-container__metadata-item')
+
+# Indeed
+_INDEED_CARD_SELECTORS = (
+    '.job_seen_beacon',
+    '.jobsearch-ResultsList .job_seen_beacon',
+    '.job_seen_beacon .job_seen_beacon',
+    '[data-jk]',
+)
+_INDEED_TITLE_SELECTORS = (
+    'h2.jobTitle span[title]',
+    '.jobTitle a',
+    'h2 a',
+    "[data-testid='jobsearch-JobComponent-title']",
+)
+_INDEED_COMPANY_SELECTORS = (
+    '.companyName',
+    '.company',
+    "[data-testid='jobsearch-JobComponent-company']",
+)
+_INDEED_LOCATION_SELECTORS = (
+    '.companyLocation',
+    '.location',
+    "[data-testid='jobsearch-JobComponent-location']",
+)
+
+# Company careers pages that share one scraping path (see _scrape_careers_page);
+# job_template holds the fields every job from the page shares
+_CAREERS_TITLE_SELECTORS = ('.job-title', '.position-title', 'h3', 'h4')
+_CAREERS_LOCATION_SELECTORS = ('.job-location', '.location', '.job-meta')
+_CAREERS_CARD_FIELDS = {'title': _CAREERS_TITLE_SELECTORS, 'location': _CAREERS_LOCATION_SELECTORS}
+_CAREERS_PAGES = {
+    'rakuten': {
+        'job_template': {'company': 'Rakuten', 'source': 'Rakuten Careers', 'job_type': 'Full-time'},
+        # Rakuten's page is searched for AI roles before the cards are read
+        'search_selectors': (
+            "input[placeholder*='search']",
+            "input[placeholder*='Search']",
+            "input[type='search']",
+            '.search-input',
+        ),
+        'card_selectors': ('.job-listing', '.job-card', '.position-card', '.job-item'),
+        'card_fields': _CAREERS_CARD_FIELDS,
+    },
+    'line': {
+        'job_template': {'company': 'LINE', 'source': 'LINE Careers', 'job_type': 'Full-time'},
+        'card_selectors': ('.job-position', '.position-card', '.job-listing', '.career-item'),
+        'card_fields': {
+            'title': ('.position-title', '.job-title', 'h3', 'h4'),
+            'location': ('.position-location', '.location', '.job-meta'),
+        },
+    },
+    'google': {
+        'job_template': {'company': 'Google', 'source': 'Google Careers', 'job_type': 'Full-time'},
+        'card_selectors': ('.job-listing', '.job-card', '.position-card', "[data-testid='job-card']"),
+        'card_fields': _CAREERS_CARD_FIELDS,
+    },
+}
+
+# Field name -> selectors, as read from one card by _CARD_FIELDS_JS
+_GENERIC_CARD_FIELDS = {'title': _GENERIC_TITLE_SELECTORS, 'location': _GENERIC_LOCATION_SELECTORS}
+_LINKEDIN_CARD_FIELDS = {
+    'title': _LINKEDIN_TITLE_SELECTORS,
+    'company': _LINKEDIN_COMPANY_SELECTORS,
+    'location': _LINKEDIN_LOCATION_SELECTORS,
+}
+_INDEED_CARD_FIELDS = {
+    'title': _INDEED_TITLE_SELECTORS,
+    'company': _INDEED_COMPANY_SELECTORS,
+    'location': _INDEED_LOCATION_SELECTORS,
+}
+
+# Reads one job card in a single WebDriver call: arguments are the card element, a
+# {field: selectors} map, the link selector and an optional {field: attribute} map.
+# Each field takes the first non-empty match in selector order (preferring the attribute
+# when one is given), as the per-field find_element loops did.
+_CARD_FIELDS_JS = """
+const [card, fields, linkSelector, attributes] = arguments;
+const result = {};
+for (const [name, selectors] of Object.entries(fields)) {
+  result[name] = '';
+  for (const selector of selectors) {
+    const el = card.querySelector(selector);
+    const text = el && ((attributes[name] && el.getAttribute(attributes[name])) || el.innerText || '').trim();
+    if (text) {
+      result[name] = text;
+      break;
+    }
+  }
+}
+const link = card.querySelector(linkSelector);
+result.url = link ? link.href : '';
+return result;
+"""
+
+# Fields shared by every job from a fixed source, filled in per job with dict(template, ...)
+_LINKEDIN_JOB_TEMPLATE = {'source': 'LinkedIn', 'job_type': 'Full-time'}
+_INDEED_JOB_TEMPLATE = {'source': 'Indeed', 'job_type': 'Full-time'}
+_MERCARI_JOB_TEMPLATE = {'company': 'Mercari', 'source': 'Mercari Careers', 'job_type': 'Full-time'}
+_AMAZON_JOB_TEMPLATE = {'company': 'Amazon', 'source': 'Amazon Careers', 'job_type': 'Full-time'}
+
+# Job-search sites searched once per configured term (see _scrape_job_board). search_url is
+# formatted with the source's base_url and the term encoded by quote; link_selector and
+# attributes are passed on to _CARD_FIELDS_JS.
+_JOB_BOARDS = {
+    'linkedin': {
+        'job_template': _LINKEDIN_JOB_TEMPLATE,
+        'search_url': "{base_url}?keywords={term}&location=Japan",
+        'quote': quote,
+        'card_selectors': _LINKEDIN_CARD_SELECTORS,
+        'card_fields': _LINKEDIN_CARD_FIELDS,
+        'link_selector': "a",
+        'scroll': True,  # LinkedIn loads more cards as the page is scrolled
+    },
+    'indeed': {
+        'job_template': _INDEED_JOB_TEMPLATE,
+        'search_url': "{base_url}?q={term}&l=Japan",
+        'quote': quote_plus,
+        'card_selectors': _INDEED_CARD_SELECTORS,
+        'card_fields': _INDEED_CARD_FIELDS,
+        # Titles are read from the title attribute first (the visible text can be truncated)
+        'link_selector': "h2.jobTitle a",
+        'attributes': {'title': 'title'},
+    },
+}
+
+# Collects title/location/link for up to arguments[0] Mercari job cards in one WebDriver call.
+# Selectors are tried in order, as the per-card find_element loops did.
+_MERCARI_CARD_SELECTORS = (".job-card", ".job-listing", ".position-card", "[data-testid='job-card']")
+_MERCARI_CARDS_JS = """
+const cardSelectors = arguments[1];
+const firstText = (card, selectors) => {
+  for (const selector of selectors) {
+    const el = card.querySelector(selector);
+    const text = el && el.innerText.trim();
+    if (text) return text;
+  }
+  return '';
+};
+let cards = [];
+for (const selector of cardSelectors) {
+  cards = [...document.querySelectorAll(selector)];
+  if (cards.length) break;
+}
+return cards.slice(0, arguments[0]).map(card => {
+  const link = card.querySelector('a');
+  return {
+    title: firstText(card, [".job-title", ".position-title", "h3", "h4"]),
+    location: firstText(card, [".job-location", ".location", ".job-meta"]),
+    url: link ? link.href : ''
+  };
+});
+"""
 
 class AIJobsScraper:
-    def __init__(self):
+    _chromedriver_path = None  # Resolved once per process, shared by every scraper
+    
+    def __init__(self, force_refresh=False):
         self.notion = NotionClient()
         self.scraped_jobs = []
         self.total_found = 0
         self.total_added = 0
-        self.driver = None
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': USER_AGENT})
+        self.driver = None  # Started on first selenium source, then reused
+        self.driver_failed = False
+        # Keep-alive session for this thread's fetches; prefetch workers get their own
+        # (see _thread_session), as requests sessions are not thread-safe
+        self.session = self._new_session()
+        self._owner_thread = threading.current_thread()
+        self._local = threading.local()
+        self._worker_sessions = []  # Closed with self.session in close()
         self.analyzer = WebsiteAnalyzer()
         self.analysis_cache = {}  # Cache analysis results
+        self.pending_analyses = {}  # In-flight analyses by URL, started by _prefetch_sources
+        # Jobs already processed this run across sources, plus recent runs' confirmed jobs
+        self.seen_jobs = JobDedup.load(SEEN_JOBS_FILE, SEEN_JOBS_TTL)
+        self.api_responses = {}  # In-flight API fetches by source key
+        self.page_cache = PageCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL)
+        self.host_limiter = PerHostLimiter(HOST_REQUEST_INTERVAL, HOST_REQUEST_JITTER)
+        self.force_refresh = force_refresh  # Revalidate every cached page instead of trusting the TTL
+        self.total_new = 0  # Jobs queued for Notion (not found there or earlier this run)
+        self.source_stats = []  # (source name, AI jobs found, new jobs, status) per source, for the run log
+        # New jobs go to a writer thread, so Notion writes overlap the next source's scraping
+        self.write_queue = queue.Queue(maxsize=NOTION_WRITE_QUEUE_SIZE)
+        self.writer = None
+        self.stats_lock = threading.Lock()  # Guards total_added and seen_jobs, shared with the writer
         
+    @staticmethod
+    def _new_session():
+        """HTTP session with a keep-alive pool, retrying transient failures"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        retry = Retry(total=MAX_RETRIES, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _thread_session(self):
+        """HTTP session for the calling thread: self.session on the scraper's own thread,
+        a private one for each prefetch worker"""
+        if threading.current_thread() is self._owner_thread:
+            return self.session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._new_session()
+            self._worker_sessions.append(session)
+        return session
+    
+    @classmethod
+    def _get_chromedriver_path(cls):
+        """Path to chromedriver, resolved through webdriver-manager only on first use"""
+        if cls._chromedriver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            from webdriver_manager.core.driver_cache import DriverCacheManager
+            # WDM_CACHE_DIR points the on-disk driver cache somewhere persistent (e.g. a CI cache)
+            cache_dir = os.getenv('WDM_CACHE_DIR')
+            cache_manager = DriverCacheManager(root_dir=cache_dir) if cache_dir else None
+            cls._chromedriver_path = ChromeDriverManager(cache_manager=cache_manager).install()
+        return cls._chromedriver_path
+    
     def setup_driver(self):
         """Setup Chrome driver for Selenium"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
         chrome_options = Options()
         for option in CHROME_OPTIONS:
             chrome_options.add_argument(option)
+        chrome_options.page_load_strategy = CHROME_PAGE_LOAD_STRATEGY
+        chrome_options.add_experimental_option('prefs', CHROME_PREFS)
         
         try:
-            self.driver = webdriver.Chrome(ChromeDriverManager().install(), options=chrome_options)
+            service = Service(self._get_chromedriver_path())
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            self._block_subresources(self.driver)
             return True
         except Exception as e:
             print(f"❌ Failed to setup Chrome driver: {e}")
+            # Don't leave Chrome running if it started but could not be configured
+            self.cleanup_driver()
             return False
     
+    @staticmethod
+    def _block_subresources(driver):
+        """Stop Chrome fetching images, fonts, stylesheets and trackers the scrapers never read"""
+        from selenium.common.exceptions import WebDriverException
+        
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(CHROME_BLOCKED_URLS)})
+        except WebDriverException as e:
+            print(f"⚠️  Could not block page subresources: {e}")
+    
     def cleanup_driver(self):
         """Clean up Chrome driver"""
         if self.driver:
@@ -53,6 +355,38 @@ class AIJobsScraper:
                 self.driver.quit()
             except:
                 pass
+            self.driver = None
+    
+    def _get_driver(self):
+        """Shared Chrome driver, started on first use; None if it cannot start"""
+        if self.driver is None and not self.driver_failed:
+            self.driver_failed = not self.setup_driver()
+        return self.driver
+    
+    def _reset_driver(self):
+        """Clear cookies and leave the current page so the next source starts clean"""
+        from selenium.common.exceptions import WebDriverException
+        
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.get('about:blank')
+        except WebDriverException as e:
+            print(f"⚠️  Could not reset browser session, restarting driver: {e}")
+            self.cleanup_driver()
+    
+    def close(self):
+        """Release the browser and HTTP connections"""
+        self.cleanup_driver()
+        self.session.close()
+        for session in self._worker_sessions:
+            session.close()
+        self._worker_sessions.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get_optimal_strategy(self, source_config):
         """Determine optimal scraping strategy for a source"""
@@ -67,10 +401,14 @@ class AIJobsScraper:
         if not url:
             return 'selenium', 0.5, "No URL provided - using selenium fallback"
         
-        # Check cache first
+        # Check cache first, then analyses started at the beginning of the run
         if url in self.analysis_cache:
             analysis = self.analysis_cache[url]
             print(f"📋 Using cached analysis for {url}")
+        elif url in self.pending_analyses:
+            analysis = self.pending_analyses.pop(url).result()
+            self.analysis_cache[url] = analysis
+            print(f"📋 Using prefetched analysis for {url}")
         else:
             print(f"🔍 Analyzing website structure: {url}")
             analysis = self.analyzer.analyze_website(url)
@@ -85,14 +423,115 @@ class AIJobsScraper:
         
         return strategy, confidence, explanation
     
+    def _prefetch_sources(self):
+        """Start fetching every enabled API source and analyzing every 'auto' source at once"""
+        api_sources = {}
+        analysis_urls = set()
+        for source_key, source_config in JOB_SOURCES.items():
+            if not source_config.get('enabled', False):
+                continue
+            scraping_type = source_config.get('type', 'auto')
+            if scraping_type == 'api' and source_config.get('url'):
+                api_sources[source_key] = source_config['url']
+            elif scraping_type == 'auto':
+                url = source_config.get('url') or source_config.get('base_url')
+                if url and url not in self.analysis_cache:
+                    analysis_urls.add(url)
+        if not api_sources and not analysis_urls:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(len(api_sources) + len(analysis_urls), API_MAX_WORKERS))
+        for source_key, url in api_sources.items():
+            self.api_responses[source_key] = executor.submit(self._fetch_cached, url)
+        for url in analysis_urls:
+            self.pending_analyses[url] = executor.submit(self._analyze_in_worker, url)
+        executor.shutdown(wait=False)
+        print(f"🔌 Fetching {len(api_sources)} API source(s) and analyzing {len(analysis_urls)} "
+              f"website(s) in parallel")
+    
+    @staticmethod
+    def _analyze_in_worker(url):
+        """Analyze a website on a prefetch worker with its own analyzer
+        
+        Like the API fetches (see _thread_session), concurrent analyses never share a requests
+        session: self.analyzer stays on the scraper's thread and each task gets a fresh one.
+        """
+        analyzer = WebsiteAnalyzer()
+        try:
+            return analyzer.analyze_website(url)
+        finally:
+            analyzer.session.close()
+    
+    def _fetch_cached(self, url):
+        """GET a URL through the on-disk cache; returns (status code, body)
+        
+        Fresh copies are used as-is; stale ones are revalidated with a conditional GET,
+        so an unchanged page costs a 304 instead of a full download.
+        """
+        if not self.force_refresh:
+            body = self.page_cache.get(url)
+            if body is not None:
+                print(f"📋 Using cached response for {url}")
+                return 200, body
+        
+        status_code, headers, body = self._get_capped(url, self.page_cache.validators(url))
+        if status_code == 304:
+            cached = self.page_cache.refresh(url)
+            if cached is not None:
+                print(f"📋 {url} unchanged since last fetch")
+                return 200, cached
+            status_code, headers, body = self._get_capped(url)  # Cache entry vanished; fetch it in full
+        if status_code == 200:
+            try:
+                self.page_cache.put(url, body, etag=headers.get('ETag'),
+                                    last_modified=headers.get('Last-Modified'))
+            except OSError as e:
+                print(f"⚠️  Could not cache response: {e}")
+        return status_code, body
+    
+    def _get_capped(self, url, headers=None):
+        """Streamed GET that gives up past MAX_RESPONSE_BYTES; returns (status code, headers, body)
+        
+        A 200 that is really a captcha / bot-check page raises ValueError too, so it is neither
+        cached nor parsed into jobs and the caller falls back to selenium.
+        """
+        host = urlparse(url).netloc
+        self.host_limiter.acquire(host)
+        with self._thread_session().get(url, headers=headers, timeout=30, stream=True) as response:
+            self.host_limiter.update(host, response.status_code, response.headers)
+            declared = response.headers.get('Content-Length', '')
+            if declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response from {url} is too large ({declared} bytes)")
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise ValueError(f"Response from {url} is larger than {MAX_RESPONSE_BYTES} bytes")
+            if response.status_code == 200 and self._is_block_page(response.url, body):
+                raise ValueError(f"{url} returned a bot-check page ({response.url})")
+            return response.status_code, response.headers, bytes(body)
+    
+    @staticmethod
+    def _is_block_page(final_url, body):
+        """Whether a response is a captcha / unusual-traffic page, judged by its URL and first 4 KB"""
+        if any(marker in final_url.lower() for marker in _BLOCK_URL_MARKERS):
+            return True
+        head = bytes(body[:4096]).lower()
+        return any(marker in head for marker in _BLOCK_PAGE_MARKERS)
+    
     def _scrape_all_sources(self):
         """Scrape all enabled sources using optimal strategies"""
+        self._prefetch_sources()
+        
         for source_key, source_config in JOB_SOURCES.items():
             if not source_config.get('enabled', False):
                 print(f"⏭️  Skipping disabled source: {source_config.get('name', source_key)}")
                 continue
                 
-            print(f"\n🔍 Processing source: {source_config.get('name', source_key)}")
+            source_name = source_config.get('name', source_key)
+            print(f"\n🔍 Processing source: {source_name}")
+            found_before, new_before = self.total_found, self.total_new
+            status = "Success"
             
             try:
                 # Get optimal strategy
@@ -101,6 +540,7 @@ class AIJobsScraper:
                 # Skip if confidence is too low
                 if confidence < 0.3:
                     print(f"⚠️  Skipping source due to low confidence ({confidence:.1%})")
+                    status = "Skipped"
                     continue
                 
                 # Execute based on strategy
@@ -113,7 +553,14 @@ class AIJobsScraper:
                     
             except Exception as e:
                 print(f"❌ Error scraping {source_key}: {e}")
+                status = "Error"
                 continue
+            
+            finally:
+                # One line per source; per-job detail is debug logging
+                found, new = self.total_found - found_before, self.total_new - new_before
+                print(f"📊 {source_name}: {found} AI jobs found, {new} new")
+                self.source_stats.append((source_name, found, new, status))
                 
             time.sleep(REQUEST_DELAY)  # Rate limiting between sources
     
@@ -127,21 +574,23 @@ class AIJobsScraper:
             return
             
         try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
+            # Use the response prefetched at the start of the run when there is one
+            pending = self.api_responses.pop(source_key, None)
+            status_code, body = pending.result() if pending else self._fetch_cached(url)
+            if status_code == 200:
                 try:
-                    data = response.json()
-                    # Handle different API response formats
-                    jobs = self._extract_jobs_from_api_response(data, source_config)
+                    data = json_codec.loads(body)
+                    # Handle different API response formats, building only the jobs that will be used
+                    jobs = self._extract_jobs_from_api_response(data, source_config, limit=MAX_JOBS_PER_SOURCE)
                     
-                    for job in jobs[:MAX_JOBS_PER_SOURCE]:
+                    for job in jobs:
                         if self._is_ai_related(job):
                             self._process_job(job)
                             
-                except json.JSONDecodeError:
+                except ValueError:  # json and orjson decode errors both subclass it
                     print("❌ Failed to parse API response as JSON")
             else:
-                print(f"❌ API returned status code: {response.status_code}")
+                print(f"❌ API returned status code: {status_code}")
                 # Fallback to selenium
                 self._scrape_with_selenium(source_key, source_config)
                 
@@ -160,16 +609,17 @@ class AIJobsScraper:
             return
             
         try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            status_code, body = self._fetch_cached(url)
+            if status_code == 200:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(body, HTML_PARSER)
                 jobs = self._extract_jobs_from_html(soup, source_config, source_key)
                 
-                for job in jobs[:MAX_JOBS_PER_SOURCE]:
-                    if self._is_ai_related(job):
-                        self._process_job(job)
+                # Jobs are extracted lazily, so elements past the limit are never read
+                for job in filter(self._is_ai_related, islice(jobs, MAX_JOBS_PER_SOURCE)):
+                    self._process_job(job)
             else:
-                print(f"❌ HTTP request returned status code: {response.status_code}")
+                print(f"❌ HTTP request returned status code: {status_code}")
                 # Fallback to selenium
                 self._scrape_with_selenium(source_key, source_config)
                 
@@ -182,27 +632,31 @@ class AIJobsScraper:
         """Scrape using Selenium (browser automation)"""
         print(f"🤖 Using selenium strategy for {source_config.get('name', source_key)}")
         
-        # Use existing selenium-based methods based on source
-        if source_key == 'linkedin':
-            self._scrape_linkedin_jobs()
-        elif source_key == 'indeed':
-            self._scrape_indeed_jobs()
-        elif source_key == 'mercari':
-            self._scrape_mercari_jobs()
-        elif source_key == 'rakuten':
-            self._scrape_rakuten_jobs()
-        elif source_key == 'line':
-            self._scrape_line_jobs()
-        elif source_key == 'google':
-            self._scrape_google_jobs()
-        elif source_key == 'amazon':
+        # Amazon's fallback reads its JSON API over the shared session - no browser needed
+        if source_key == 'amazon':
             self._scrape_amazon_jobs()
-        else:
-            # Generic selenium scraping for new sources
-            self._scrape_generic_selenium(source_key, source_config)
+            return
+        
+        if self._get_driver() is None:
+            print("❌ Cannot setup web driver. Skipping source.")
+            return
+        
+        try:
+            # Use existing selenium-based methods based on source
+            if source_key in _JOB_BOARDS:
+                self._scrape_job_board(source_key)
+            elif source_key == 'mercari':
+                self._scrape_mercari_jobs()
+            elif source_key in _CAREERS_PAGES:
+                self._scrape_careers_page(source_key)
+            else:
+                # Generic selenium scraping for new sources
+                self._scrape_generic_selenium(source_key, source_config)
+        finally:
+            self._reset_driver()
     
-    def _extract_jobs_from_api_response(self, data, source_config):
-        """Extract jobs from API response data"""
+    def _extract_jobs_from_api_response(self, data, source_config, limit=None):
+        """Extract jobs from API response data, stopping after `limit` jobs"""
         jobs = []
         
         # Common API response formats
@@ -219,13 +673,15 @@ class AIJobsScraper:
             jobs_data = []
         
         for job_data in jobs_data:
+            if limit is not None and len(jobs) >= limit:
+                break
             if isinstance(job_data, dict):
                 job = {
                     'title': job_data.get('title') or job_data.get('name') or '',
                     'company': job_data.get('company') or source_config.get('name', 'Unknown'),
                     'location': job_data.get('location') or job_data.get('city') or 'Japan',
                     'url': job_data.get('url') or job_data.get('link') or '',
-                    'description': job_data.get('description') or job_data.get('summary') or '',
+                    'description': (job_data.get('description') or job_data.get('summary') or '')[:MAX_DESCRIPTION_LENGTH],
                     'source': source_config.get('name', 'API'),
                     'job_type': job_data.get('type') or 'Full-time'
                 }
@@ -235,18 +691,10 @@ class AIJobsScraper:
         return jobs
     
     def _extract_jobs_from_html(self, soup, source_config, source_key):
-        """Extract jobs from HTML using BeautifulSoup"""
-        jobs = []
-        
+        """Yield jobs extracted from HTML using BeautifulSoup, one listing element at a time"""
         # Common job listing selectors
-        job_selectors = [
-            '.job-card', '.job-listing', '.job-item', '.job-post',
-            '.position-card', '.career-item', '.opening-item',
-            '[data-job]', '[data-position]', '.posting'
-        ]
-        
         job_elements = []
-        for selector in job_selectors:
+        for selector in _HTML_JOB_SELECTORS:
             elements = soup.select(selector)
             if elements:
                 job_elements = elements
@@ -255,35 +703,30 @@ class AIJobsScraper:
         for element in job_elements:
             job = self._extract_job_from_element(element, source_config)
             if job:
-                jobs.append(job)
-        
-        return jobs
+                yield job
     
     def _extract_job_from_element(self, element, source_config):
         """Extract job data from a single HTML element"""
         try:
             # Extract title
-            title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.job-title', '.position-title']
             title = ""
-            for selector in title_selectors:
+            for selector in _HTML_TITLE_SELECTORS:
                 title_elem = element.select_one(selector)
                 if title_elem:
                     title = title_elem.get_text(strip=True)
                     break
             
             # Extract company (default to source name)
-            company_selectors = ['.company', '.company-name', '.employer']
             company = source_config.get('name', 'Unknown')
-            for selector in company_selectors:
+            for selector in _HTML_COMPANY_SELECTORS:
                 company_elem = element.select_one(selector)
                 if company_elem:
                     company = company_elem.get_text(strip=True)
                     break
             
             # Extract location
-            location_selectors = ['.location', '.job-location', '.city']
             location = "Japan"
-            for selector in location_selectors:
+            for selector in _HTML_LOCATION_SELECTORS:
                 location_elem = element.select_one(selector)
                 if location_elem:
                     location = location_elem.get_text(strip=True)
@@ -318,6 +761,32 @@ class AIJobsScraper:
             print(f"❌ Error extracting job from element: {e}")
             return None
     
+    def _wait_for_elements(self, selectors, timeout=ELEMENT_WAIT_TIMEOUT):
+        """Elements (job cards, search boxes) for the first selector that matches, polling until
+        one does; [] on timeout"""
+        from selenium.common.exceptions import InvalidSelectorException, TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        def first_match(driver):
+            for selector in selectors:
+                try:
+                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                except InvalidSelectorException:
+                    continue
+                if elements:
+                    return elements
+            return False
+        
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(first_match)
+        except TimeoutException:
+            return []
+    
+    def _read_card(self, card, fields, link_selector="a", attributes=None):
+        """Read a job card's fields and link in one WebDriver call (see _CARD_FIELDS_JS)"""
+        return self.driver.execute_script(_CARD_FIELDS_JS, card, fields, link_selector, attributes or {}) or {}
+    
     def _scrape_generic_selenium(self, source_key, source_config):
         """Generic selenium scraping for new sources"""
         try:
@@ -327,22 +796,7 @@ class AIJobsScraper:
                 return
                 
             self.driver.get(url)
-            time.sleep(5)
-            
-            # Use similar approach as existing selenium methods
-            selectors = [
-                ".job-card", ".job-listing", ".job-item", ".job-post",
-                ".position-card", ".career-item", "[data-job]"
-            ]
-            
-            job_cards = []
-            for selector in selectors:
-                try:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
-                except:
-                    continue
+            job_cards = self._wait_for_elements(_GENERIC_CARD_SELECTORS)
             
             for card in job_cards[:MAX_JOBS_PER_SOURCE]:
                 try:
@@ -359,50 +813,16 @@ class AIJobsScraper:
     def _extract_selenium_job_generic(self, card, source_config):
         """Generic job extraction from selenium element"""
         try:
-            # Try multiple selectors for title
-            title_selectors = [
-                "h1", "h2", "h3", "h4", ".title", ".job-title", 
-                ".position-title", ".posting-title"
-            ]
-            
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location_selectors = [".location", ".job-location", ".city", ".address"]
-            location = "Japan"
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
+            fields = self._read_card(card, _GENERIC_CARD_FIELDS)
+            title = fields.get('title', '')
             if not title:
                 return None
             
             return {
                 'title': title,
                 'company': source_config.get('name', 'Unknown'),
-                'location': location,
-                'url': job_url,
+                'location': fields.get('location') or "Japan",
+                'url': fields.get('url', ''),
                 'description': f"Position at {source_config.get('name', 'Company')}. {title}",
                 'source': source_config.get('name', 'Web'),
                 'job_type': 'Full-time'
@@ -422,20 +842,23 @@ class AIJobsScraper:
             print("❌ Cannot connect to Notion. Exiting.")
             return
         
-        # Setup Selenium driver
-        if not self.setup_driver():
-            print("❌ Cannot setup web driver. Exiting.")
-            return
+        # One paginated query up front; duplicate checks are then in-memory lookups
+        self.notion.load_existing_keys()
         
         try:
             # Scrape from configured sources using optimal strategy
             self._scrape_all_sources()
             
         finally:
-            self.cleanup_driver()
+            self._finish_writes()
+            self.close()
+            self._save_seen_jobs()
         
-        # Log activity
-        self.notion.log_scraping_activity("AI Jobs Scraper", self.total_found, self.total_added)
+        # Log activity - one change log entry per run, with the per-source breakdown in its body
+        breakdown = [f"{name}: {found} found, {new} new ({status})" for name, found, new, status in self.source_stats]
+        self.notion.log_scraping_activity("AI Jobs Scraper", self.total_found, self.total_added,
+                                          breakdown=breakdown)
+        self.notion.flush_logs()
         
         # Summary
         print(f"\n🎉 Scraping completed!")
@@ -443,268 +866,62 @@ class AIJobsScraper:
         print(f"➕ Total jobs added: {self.total_added}")
         print(f"📝 Check your Notion database: https://www.notion.so/{AI_JOBS_DATABASE_ID}")
     
-    def _scrape_linkedin_jobs(self):
-        """Scrape AI jobs from LinkedIn"""
-        print("\n🔍 Scraping LinkedIn AI jobs...")
-        
-        source_config = JOB_SOURCES['linkedin']
+    def _scrape_job_board(self, source_key):
+        """Scrape AI jobs from a job-search site described in _JOB_BOARDS, one search per term"""
+        board = _JOB_BOARDS[source_key]
+        source_config = JOB_SOURCES[source_key]
+        name = board['job_template']['source']
+        print(f"\n🔍 Scraping {name} AI jobs...")
         
         for term in source_config['search_terms']:
             try:
-                url = f"{source_config['base_url']}?keywords={term.replace(' ', '%20')}&location=Japan"
+                url = board['search_url'].format(base_url=source_config['base_url'], term=board['quote'](term))
                 print(f"📄 Searching: {term}")
                 
                 self.driver.get(url)
-                time.sleep(5)  # Wait for page load
-                
-                # Scroll to load more jobs
-                for _ in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                job_cards = self._wait_for_elements(board['card_selectors'])
                 
-                # Try multiple selectors for job cards
-                selectors = [
-                    ".job-search-card",
-                    ".job-card-container",
-                    ".job-card",
-                    "[data-job-id]"
-                ]
-                
-                job_cards = []
-                for selector in selectors:
-                    try:
-                        job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if job_cards:
-                            break
-                    except:
-                        continue
+                # Scroll to load more jobs, unless the first screen already has enough
+                if board.get('scroll') and 0 < len(job_cards) < MAX_JOBS_PER_SEARCH:
+                    for _ in range(3):
+                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        time.sleep(2)
+                    job_cards = self._wait_for_elements(board['card_selectors'])
                 
                 for card in job_cards[:MAX_JOBS_PER_SEARCH]:
                     try:
-                        job_data = self._extract_linkedin_job(card)
+                        job_data = self._extract_board_job(card, board)
                         if job_data and self._is_ai_related(job_data):
                             self._process_job(job_data)
                     except Exception as e:
-                        print(f"❌ Error extracting LinkedIn job: {e}")
+                        print(f"❌ Error extracting {name} job: {e}")
                         continue
                 
                 time.sleep(REQUEST_DELAY)  # Rate limiting
                 
             except Exception as e:
-                print(f"❌ Error scraping LinkedIn for {term}: {e}")
+                print(f"❌ Error scraping {name} for {term}: {e}")
                 continue
     
-    def _extract_linkedin_job(self, card):
-        """Extract job data from LinkedIn job card"""
+    def _extract_board_job(self, card, board):
+        """Extract job data from a job-search site's job card"""
+        template = board['job_template']
         try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                ".job-search-card__title",
-                ".job-card-list__title",
-                "h3",
-                "[data-test-job-card-list__title]"
-            ]
-            
-            company_selectors = [
-                ".job-search-card__subtitle",
-                ".job-card-container__company-name",
-                ".job-card-container__subtitle"
-            ]
-            
-            location_selectors = [
-                ".job-search-card__location",
-                ".job-card-container__metadata-item"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract company
-            company = ""
-            for selector in company_selectors:
-                try:
-                    company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    company = company_elem.text.strip()
-                    if company:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
+            fields = self._read_card(card, board['card_fields'], link_selector=board['link_selector'],
+                                     attributes=board.get('attributes'))
+            title, company = fields.get('title', ''), fields.get('company', '')
             if not title or not company:
                 return None
             
             # Get description (basic)
-            description = f"AI/ML position at {company}. Apply through LinkedIn."
+            description = f"AI/ML position at {company}. Apply through {template['source']}."
             
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'LinkedIn',
-                'job_type': 'Full-time'
-            }
+            return dict(template, title=title, company=company,
+                        location=fields.get('location') or "Japan", url=fields.get('url', ''),
+                        description=description)
             
         except Exception as e:
-            print(f"❌ Error extracting LinkedIn job data: {e}")
-            return None
-    
-    def _scrape_indeed_jobs(self):
-        """Scrape AI jobs from Indeed"""
-        print("\n🔍 Scraping Indeed AI jobs...")
-        
-        source_config = JOB_SOURCES['indeed']
-        
-        for term in source_config['search_terms']:
-            try:
-                url = f"{source_config['base_url']}?q={term.replace(' ', '+')}&l=Japan"
-                print(f"📄 Searching: {term}")
-                
-                self.driver.get(url)
-                time.sleep(5)
-                
-                # Try multiple selectors for job cards
-                selectors = [
-                    ".job_seen_beacon",
-                    ".jobsearch-ResultsList .job_seen_beacon",
-                    ".job_seen_beacon .job_seen_beacon",
-                    "[data-jk]"
-                ]
-                
-                job_cards = []
-                for selector in selectors:
-                    try:
-                        job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if job_cards:
-                            break
-                    except:
-                        continue
-                
-                for card in job_cards[:MAX_JOBS_PER_SEARCH]:
-                    try:
-                        job_data = self._extract_indeed_job(card)
-                        if job_data and self._is_ai_related(job_data):
-                            self._process_job(job_data)
-                    except Exception as e:
-                        print(f"❌ Error extracting Indeed job: {e}")
-                        continue
-                
-                time.sleep(REQUEST_DELAY)  # Rate limiting
-                
-            except Exception as e:
-                print(f"❌ Error scraping Indeed for {term}: {e}")
-                continue
-    
-    def _extract_indeed_job(self, card):
-        """Extract job data from Indeed job card"""
-        try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                "h2.jobTitle span[title]",
-                ".jobTitle a",
-                "h2 a",
-                "[data-testid='jobsearch-JobComponent-title']"
-            ]
-            
-            company_selectors = [
-                ".companyName",
-                ".company",
-                "[data-testid='jobsearch-JobComponent-company']"
-            ]
-            
-            location_selectors = [
-                ".companyLocation",
-                ".location",
-                "[data-testid='jobsearch-JobComponent-location']"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.get_attribute("title") or title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract company
-            company = ""
-            for selector in company_selectors:
-                try:
-                    company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    company = company_elem.text.strip()
-                    if company:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "h2.jobTitle a")
-                job_url = "https://jp.indeed.com" + link_elem.get_attribute("href")
-            except:
-                pass
-            
-            if not title or not company:
-                return None
-            
-            # Get description (basic)
-            description = f"AI/ML position at {company}. Apply through Indeed."
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'Indeed',
-                'job_type': 'Full-time'
-            }
-            
-        except Exception as e:
-            print(f"❌ Error extracting Indeed job data: {e}")
+            print(f"❌ Error extracting {template['source']} job data: {e}")
             return None
     
     def _scrape_mercari_jobs(self):
@@ -714,26 +931,19 @@ class AIJobsScraper:
         try:
             url = JOB_SOURCES['mercari']['url']
             self.driver.get(url)
-            time.sleep(5)
+            self._wait_for_elements(_MERCARI_CARD_SELECTORS)
             
-            # Try multiple selectors for job cards
-            selectors = [
-                ".job-card",
-                ".job-listing",
-                ".position-card",
-                "[data-testid='job-card']"
-            ]
+            # Read every card's fields in one round-trip instead of several find_element calls per card
+            cards = self.driver.execute_script(_MERCARI_CARDS_JS, MAX_JOBS_PER_SOURCE,
+                                               list(_MERCARI_CARD_SELECTORS)) or []
             
-            job_cards = []
-            for selector in selectors:
-                try:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
-                except:
+            # Nested or repeated cards show the same posting more than once - parse each once
+            seen = set()
+            for card in cards:
+                signature = (card.get('title', '').strip().lower(), card.get('url', '').split('?')[0])
+                if signature in seen:
                     continue
-            
-            for card in job_cards[:MAX_JOBS_PER_SOURCE]:
+                seen.add(signature)
                 try:
                     job_data = self._extract_mercari_job(card)
                     if job_data and self._is_ai_related(job_data):
@@ -746,415 +956,75 @@ class AIJobsScraper:
             print(f"❌ Error scraping Mercari: {e}")
     
     def _extract_mercari_job(self, card):
-        """Extract job data from Mercari job card"""
-        try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                ".job-title",
-                ".position-title",
-                "h3",
-                "h4"
-            ]
-            
-            location_selectors = [
-                ".job-location",
-                ".location",
-                ".job-meta"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
-            if not title:
-                return None
-            
-            # Mercari is the company
-            company = "Mercari"
-            
-            description = f"Engineering position at Mercari. {title}"
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'Mercari Careers',
-                'job_type': 'Full-time'
-            }
-            
-        except Exception as e:
-            print(f"❌ Error extracting Mercari job data: {e}")
+        """Build job data from the fields read off a Mercari job card"""
+        title = card.get('title', '')
+        if not title:
             return None
-    
-    def _scrape_rakuten_jobs(self):
-        """Scrape jobs from Rakuten careers"""
-        print("\n🔍 Scraping Rakuten AI jobs...")
         
-        try:
-            url = JOB_SOURCES['rakuten']['url']
-            self.driver.get(url)
-            time.sleep(5)
-            
-            # Try to search for AI/ML related jobs
-            try:
-                search_selectors = [
-                    "input[placeholder*='search']",
-                    "input[placeholder*='Search']",
-                    "input[type='search']",
-                    ".search-input"
-                ]
-                
-                search_box = None
-                for selector in search_selectors:
-                    try:
-                        search_box = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        break
-                    except:
-                        continue
-                
-                if search_box:
-                    search_box.clear()
-                    search_box.send_keys("AI Machine Learning")
-                    search_box.submit()
-                    time.sleep(3)
-            except:
-                pass  # Continue without search if it fails
-            
-            # Try multiple selectors for job cards
-            selectors = [
-                ".job-listing",
-                ".job-card",
-                ".position-card",
-                ".job-item"
-            ]
-            
-            job_cards = []
-            for selector in selectors:
-                try:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
-                except:
-                    continue
-            
-            for card in job_cards[:MAX_JOBS_PER_SOURCE]:
-                try:
-                    job_data = self._extract_rakuten_job(card)
-                    if job_data and self._is_ai_related(job_data):
-                        self._process_job(job_data)
-                except Exception as e:
-                    print(f"❌ Error extracting Rakuten job: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"❌ Error scraping Rakuten: {e}")
-    
-    def _extract_rakuten_job(self, card):
-        """Extract job data from Rakuten job card"""
-        try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                ".job-title",
-                ".position-title",
-                "h3",
-                "h4"
-            ]
-            
-            location_selectors = [
-                ".job-location",
-                ".location",
-                ".job-meta"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
-            if not title:
-                return None
-            
-            company = "Rakuten"
-            
-            description = f"AI/ML position at Rakuten. {title}"
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'Rakuten Careers',
-                'job_type': 'Full-time'
-            }
-            
-        except Exception as e:
-            print(f"❌ Error extracting Rakuten job data: {e}")
-            return None
+        return dict(_MERCARI_JOB_TEMPLATE, title=title, location=card.get('location') or "Japan",
+                    url=card.get('url', ''), description=f"Engineering position at Mercari. {title}")
     
-    def _scrape_line_jobs(self):
-        """Scrape jobs from LINE careers"""
-        print("\n🔍 Scraping LINE AI jobs...")
+    def _scrape_careers_page(self, source_key):
+        """Scrape jobs from a company careers page described in _CAREERS_PAGES"""
+        page = _CAREERS_PAGES[source_key]
+        company = page['job_template']['company']
+        print(f"\n🔍 Scraping {company} AI jobs...")
         
         try:
-            url = JOB_SOURCES['line']['url']
+            url = JOB_SOURCES[source_key]['url']
             self.driver.get(url)
-            time.sleep(5)
-            
-            # Try multiple selectors for job cards
-            selectors = [
-                ".job-position",
-                ".position-card",
-                ".job-listing",
-                ".career-item"
-            ]
-            
-            job_cards = []
-            for selector in selectors:
-                try:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
-                except:
-                    continue
+            if page.get('search_selectors'):
+                self._search_careers_page(page['search_selectors'])
+            job_cards = self._wait_for_elements(page['card_selectors'])
             
             for card in job_cards[:MAX_JOBS_PER_SOURCE]:
                 try:
-                    job_data = self._extract_line_job(card)
+                    job_data = self._extract_careers_job(card, page)
                     if job_data and self._is_ai_related(job_data):
                         self._process_job(job_data)
                 except Exception as e:
-                    print(f"❌ Error extracting LINE job: {e}")
+                    print(f"❌ Error extracting {company} job: {e}")
                     continue
                     
         except Exception as e:
-            print(f"❌ Error scraping LINE: {e}")
-    
-    def _extract_line_job(self, card):
-        """Extract job data from LINE job card"""
-        try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                ".position-title",
-                ".job-title",
-                "h3",
-                "h4"
-            ]
-            
-            location_selectors = [
-                ".position-location",
-                ".location",
-                ".job-meta"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
-            if not title:
-                return None
-            
-            company = "LINE"
-            
-            description = f"AI/ML position at LINE. {title}"
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'LINE Careers',
-                'job_type': 'Full-time'
-            }
-            
-        except Exception as e:
-            print(f"❌ Error extracting LINE job data: {e}")
-            return None
+            print(f"❌ Error scraping {company}: {e}")
     
-    def _scrape_google_jobs(self):
-        """Scrape jobs from Google careers"""
-        print("\n🔍 Scraping Google AI jobs...")
+    def _search_careers_page(self, search_selectors):
+        """Search the current careers page for AI/ML related jobs, if it has a search box"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
         
         try:
-            url = JOB_SOURCES['google']['url']
-            self.driver.get(url)
-            time.sleep(5)
-            
-            # Try multiple selectors for job cards
-            selectors = [
-                ".job-listing",
-                ".job-card",
-                ".position-card",
-                "[data-testid='job-card']"
-            ]
-            
-            job_cards = []
-            for selector in selectors:
-                try:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
-                except:
-                    continue
-            
-            for card in job_cards[:MAX_JOBS_PER_SOURCE]:
+            search_boxes = self._wait_for_elements(search_selectors)
+            if search_boxes:
+                search_box = search_boxes[0]
+                search_box.clear()
+                search_box.send_keys("AI Machine Learning")
+                search_box.submit()
+                # A form submit replaces the page; in-page searches just get the full 3 seconds
                 try:
-                    job_data = self._extract_google_job(card)
-                    if job_data and self._is_ai_related(job_data):
-                        self._process_job(job_data)
-                except Exception as e:
-                    print(f"❌ Error extracting Google job: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"❌ Error scraping Google: {e}")
+                    WebDriverWait(self.driver, 3).until(EC.staleness_of(search_box))
+                except TimeoutException:
+                    pass
+        except:
+            pass  # Continue without search if it fails
     
-    def _extract_google_job(self, card):
-        """Extract job data from Google job card"""
+    def _extract_careers_job(self, card, page):
+        """Extract job data from a careers page job card"""
         try:
-            # Try multiple selectors for each field
-            title_selectors = [
-                ".job-title",
-                ".position-title",
-                "h3",
-                "h4"
-            ]
-            
-            location_selectors = [
-                ".job-location",
-                ".location",
-                ".job-meta"
-            ]
-            
-            # Extract title
-            title = ""
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Get job URL
-            job_url = ""
-            try:
-                link_elem = card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_elem.get_attribute("href")
-            except:
-                pass
-            
+            fields = self._read_card(card, page['card_fields'])
+            title = fields.get('title', '')
             if not title:
                 return None
             
-            company = "Google"
-            
-            description = f"AI/ML position at Google. {title}"
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location or "Japan",
-                'url': job_url,
-                'description': description,
-                'source': 'Google Careers',
-                'job_type': 'Full-time'
-            }
+            template = page['job_template']
+            return dict(template, title=title, location=fields.get('location') or "Japan",
+                        url=fields.get('url', ''),
+                        description=f"AI/ML position at {template['company']}. {title}")
             
         except Exception as e:
-            print(f"❌ Error extracting Google job data: {e}")
+            print(f"❌ Error extracting {page['job_template']['company']} job data: {e}")
             return None
     
     def _scrape_amazon_jobs(self):
@@ -1167,7 +1037,7 @@ class AIJobsScraper:
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json_codec.loads(response.content)
                     jobs = data.get('hits', [])
                     
                     for job in jobs[:MAX_JOBS_PER_SOURCE]:
@@ -1179,7 +1049,7 @@ class AIJobsScraper:
                             print(f"❌ Error extracting Amazon job: {e}")
                             continue
                             
-                except json.JSONDecodeError:
+                except ValueError:
                     print("❌ Failed to parse Amazon API response")
             else:
                 print(f"❌ Amazon API returned status code: {response.status_code}")
@@ -1191,23 +1061,15 @@ class AIJobsScraper:
         """Extract job data from Amazon API response"""
         try:
             title = job.get('title', '')
-            company = "Amazon"
             location = job.get('location', 'Japan')
             job_url = job.get('url', '')
-            description = job.get('description', f"AI/ML position at Amazon. {title}")
+            description = (job.get('description') or f"AI/ML position at Amazon. {title}")[:MAX_DESCRIPTION_LENGTH]
             
             if not title:
                 return None
             
-            return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'url': job_url,
-                'description': description,
-                'source': 'Amazon Careers',
-                'job_type': 'Full-time'
-            }
+            return dict(_AMAZON_JOB_TEMPLATE, title=title, location=location, url=job_url,
+                        description=description)
             
         except Exception as e:
             print(f"❌ Error extracting Amazon job data: {e}")
@@ -1215,40 +1077,99 @@ class AIJobsScraper:
     
     def _is_ai_related(self, job_data):
         """Check if job is AI/ML related"""
-        title = job_data.get('title', '').lower()
-        description = job_data.get('description', '').lower()
-        
-        for keyword in AI_KEYWORDS:
-            if keyword in title or keyword in description:
-                return True
-        
-        return False
+        return bool(AI_KEYWORDS_RE.search(job_data.get('title', '')) or
+                    AI_KEYWORDS_RE.search(job_data.get('description', '')))
+    
+    def _save_seen_jobs(self):
+        """Persist fingerprints of jobs confirmed in Notion for the next runs"""
+        try:
+            self.seen_jobs.save(SEEN_JOBS_FILE)
+        except OSError as e:
+            print(f"⚠️  Could not save seen jobs: {e}")
     
     def _process_job(self, job_data):
-        """Process and add job to Notion"""
+        """Check a job for duplicates and queue it for the Notion writer thread"""
         try:
-            print(f"\n📝 Processing: {job_data['title']} at {job_data['company']}")
-            
-            # Check for duplicates
-            if not self.notion.check_job_exists(job_data['title'], job_data['company']):
-                # Add to Notion
-                if self.notion.create_job_entry(job_data):
-                    self.total_added += 1
-                    print(f"✅ Successfully added job!")
-                else:
-                    print(f"❌ Failed to add job")
+            title, company = job_data['title'], job_data['company']
+            logger.debug("Processing: %s at %s", title, company)
+            
+            # Check for duplicates - same posting seen earlier this run, then Notion.
+            # The fingerprint is computed once and travels with the job to the writer thread.
+            fingerprint = job_fingerprint(title, company)
+            with self.stats_lock:
+                is_new = self.seen_jobs.add_fingerprint(fingerprint)
+            if not is_new:
+                logger.debug("Skipping duplicate job (already seen): %s", title)
+            elif not self.notion.check_job_exists(title, company, fingerprint):
+                self._queue_job(job_data, fingerprint)
             else:
-                print(f"⏭️  Skipping duplicate job")
+                with self.stats_lock:
+                    self.seen_jobs.settle_fingerprint(fingerprint)
+                logger.debug("Skipping duplicate job (already in Notion): %s", title)
             
             self.total_found += 1
             
         except Exception as e:
             print(f"❌ Error processing job {job_data.get('title', 'Unknown')}: {e}")
+    
+    def _queue_job(self, job_data, fingerprint):
+        """Hand a new job to the Notion writer thread, starting it on first use"""
+        if self.writer is None:
+            self.writer = threading.Thread(target=self._write_jobs, name='notion-writer', daemon=True)
+            self.writer.start()
+        self.write_queue.put((job_data, fingerprint))
+        self.total_new += 1
+    
+    def _write_jobs(self):
+        """Writer thread: create Notion entries for queued jobs until the None sentinel arrives"""
+        done = False
+        while not done:
+            batch = [self.write_queue.get()]
+            # Take whatever else is already waiting so create_job_entries can post it concurrently
+            while len(batch) < NOTION_MAX_WORKERS:
+                try:
+                    batch.append(self.write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                done = True
+                batch.pop()
+            if not batch:
+                continue
+            
+            try:
+                page_ids = self.notion.create_job_entries([job_data for job_data, _ in batch],
+                                                         fingerprints=[fingerprint for _, fingerprint in batch])
+            except Exception as e:
+                print(f"❌ Error adding jobs to Notion: {e}")
+                continue
+            with self.stats_lock:
+                for (_, fingerprint), page_id in zip(batch, page_ids):
+                    if page_id:
+                        self.total_added += 1
+                        self.seen_jobs.settle_fingerprint(fingerprint)
+    
+    def _finish_writes(self):
+        """Wait until the writer thread has stored every queued job"""
+        if self.writer is not None:
+            self.write_queue.put(None)
+            self.writer.join()
+            self.writer = None
+
 
 def main():
     """Main entry point"""
-    scraper = AIJobsScraper()
-    scraper.run()
+    parser = argparse.ArgumentParser(description="Scrape AI jobs in Japan into Notion")
+    parser.add_argument('--force-refresh', action='store_true',
+                        help="revalidate every cached page instead of reusing fresh copies")
+    args = parser.parse_args()
+    
+    # LOG_LEVEL=DEBUG shows per-job detail (duplicates skipped, Notion payloads); unknown names mean INFO
+    level = logging.getLevelName(os.getenv('LOG_LEVEL', 'INFO').upper())
+    logging.basicConfig(level=level if isinstance(level, int) else logging.INFO,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    with AIJobsScraper(force_refresh=args.force_refresh) as scraper:
+        scraper.run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper configuration
+"""
+
+import unittest
+from config import AI_KEYWORDS_RE
+
+
+class TestAIKeywords(unittest.TestCase):
+    """Test cases for AI_KEYWORDS_RE"""
+
+    def test_english_titles(self):
+        """Test that AI keywords match as whole words, plurals included"""
+        for title in ("Machine Learning Engineer", "AI Researcher", "Data Science Lead",
+                      "NLP Engineer", "Senior MLOps Engineer", "Recommendation Models"):
+            self.assertTrue(AI_KEYWORDS_RE.search(title), title)
+
+    def test_japanese_titles(self):
+        """Test that keywords directly followed or preceded by Japanese text still match"""
+        for title in ("AIエンジニア", "MLエンジニア", "機械学習・AI研究者", "シニアNLPエンジニア"):
+            self.assertTrue(AI_KEYWORDS_RE.search(title), title)
+
+    def test_keywords_inside_words_do_not_match(self):
+        """Test that keywords embedded in longer ASCII words are ignored"""
+        for title in ("HTML Developer", "Email Marketing Manager", "Sales Manager"):
+            self.assertIsNone(AI_KEYWORDS_RE.search(title), title)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for job deduplication
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from job_dedup import JobDedup, job_fingerprint
+
+
+class TestJobDedup(unittest.TestCase):
+    """Test cases for JobDedup"""
+
+    def setUp(self):
+        """Set up a temporary seen-jobs file"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'data', 'seen_jobs.json')
+
+    def test_fingerprint_ignores_case_and_punctuation(self):
+        """Test that trivially different postings share a fingerprint"""
+        self.assertEqual(job_fingerprint("ML Engineer (Tokyo)", "Mercari"),
+                         job_fingerprint("ml engineer - tokyo", " MERCARI "))
+
+    def test_add_rejects_repeats(self):
+        """Test that a job is only accepted the first time"""
+        dedup = JobDedup()
+        job = {'title': 'ML Engineer', 'company': 'Mercari'}
+
+        self.assertTrue(dedup.add(job))
+        self.assertFalse(dedup.add(dict(job)))
+
+    def test_precomputed_fingerprints_match_jobs(self):
+        """Test that the fingerprint methods agree with the job-dict ones"""
+        dedup = JobDedup()
+        job = {'title': 'ML Engineer', 'company': 'Mercari'}
+
+        self.assertTrue(dedup.add_fingerprint(job_fingerprint(job['title'], job['company'])))
+        self.assertFalse(dedup.add(job))
+        dedup.settle_fingerprint(job_fingerprint(job['title'], job['company']))
+        self.assertEqual(len(dedup.settled), 1)
+
+    def test_settled_jobs_survive_a_reload(self):
+        """Test that settled jobs are skipped by the next run but merely seen ones are not"""
+        dedup = JobDedup()
+        dedup.add({'title': 'Data Scientist', 'company': 'LINE'})
+        dedup.settle({'title': 'ML Engineer', 'company': 'Mercari'})
+        dedup.save(self.path)
+
+        reloaded = JobDedup.load(self.path, max_age=60)
+
+        self.assertIn({'title': 'ML Engineer', 'company': 'Mercari'}, reloaded)
+        self.assertNotIn({'title': 'Data Scientist', 'company': 'LINE'}, reloaded)
+
+    def test_expired_jobs_are_dropped(self):
+        """Test that fingerprints older than max_age are not loaded"""
+        dedup = JobDedup()
+        with patch('job_dedup.time.time', return_value=1000.0):
+            dedup.settle({'title': 'ML Engineer', 'company': 'Mercari'})
+        dedup.save(self.path)
+
+        with patch('job_dedup.time.time', return_value=1000.0 + 61):
+            self.assertEqual(len(JobDedup.load(self.path, max_age=60)), 0)
+
+    def test_missing_file_loads_empty(self):
+        """Test that a first run starts with nothing seen"""
+        self.assertEqual(len(JobDedup.load(self.path, max_age=60)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
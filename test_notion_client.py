@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Tests for the Notion client
+"""
+
+import gc
+import unittest
+import weakref
+from unittest.mock import Mock, patch
+from config import AI_JOBS_DATABASE_ID, CHANGE_LOG_DATABASE_ID
+from job_dedup import job_fingerprint
+from notion_client import NotionClient, _flush_logs_at_exit
+
+
+class TestAIRelevance(unittest.TestCase):
+    """Test cases for NotionClient._calculate_ai_relevance"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = NotionClient()
+
+    def test_high_relevance(self):
+        """Test that core AI/ML roles rank High"""
+        self.assertEqual(self.client._calculate_ai_relevance("Machine Learning Engineer", ""), "High")
+        self.assertEqual(self.client._calculate_ai_relevance("Engineer", "Work on NLP models"), "High")
+
+    def test_medium_relevance(self):
+        """Test that adjacent roles rank Medium"""
+        self.assertEqual(self.client._calculate_ai_relevance("Backend Developer", "Python services"), "Medium")
+
+    def test_low_relevance(self):
+        """Test that generic tech roles rank Low"""
+        self.assertEqual(self.client._calculate_ai_relevance("Frontend Developer", "React"), "Low")
+
+    def test_unknown_relevance(self):
+        """Test that unrelated roles are Unknown"""
+        self.assertEqual(self.client._calculate_ai_relevance("Sales Manager", "B2B accounts"), "Unknown")
+
+    def test_case_insensitive(self):
+        """Test that matching ignores case"""
+        self.assertEqual(self.client._calculate_ai_relevance("DEEP LEARNING RESEARCHER", ""), "High")
+
+    def test_higher_tier_wins(self):
+        """Test that the highest matching tier is returned"""
+        self.assertEqual(self.client._calculate_ai_relevance("Software Engineer", "Computer Vision team"), "High")
+
+
+def _page(title, company):
+    """A database query result page with the given title and company"""
+    return {'properties': {
+        'Job Title': {'title': [{'plain_text': title}]},
+        'Company': {'select': {'name': company} if company else None},
+    }}
+
+
+class TestExistingJobs(unittest.TestCase):
+    """Test cases for duplicate checks against existing database entries"""
+
+    def setUp(self):
+        """Set up a client with a fake Notion API"""
+        self.client = NotionClient()
+        self.client._schemas[AI_JOBS_DATABASE_ID] = {'Job Title': 'title', 'Company': 'select'}
+        self.responses = []
+        patcher = patch.object(NotionClient, '_make_request', side_effect=lambda *args: self.responses.pop(0))
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_loads_all_pages(self):
+        """Test that every page of query results is loaded"""
+        self.responses = [
+            {'results': [_page('ML Engineer', 'Mercari')], 'has_more': True, 'next_cursor': 'c1'},
+            {'results': [_page('Data Scientist', None)], 'has_more': False},
+        ]
+
+        self.assertEqual(self.client.load_existing_keys(), 2)
+        self.assertEqual(self.mock_request.call_args_list[1].args[2]['start_cursor'], 'c1')
+
+    def test_requests_only_key_properties(self):
+        """Test that the preload asks Notion for just the title and company properties"""
+        self.client._property_ids[AI_JOBS_DATABASE_ID] = {'Job Title': 'title', 'Company': '%3AUPp'}
+        self.responses = [{'results': [], 'has_more': False}]
+
+        self.client.load_existing_keys()
+
+        url = self.mock_request.call_args.args[1]
+        self.assertTrue(url.endswith('/query?filter_properties=title&filter_properties=%3AUPp'))
+
+    def test_check_uses_loaded_keys(self):
+        """Test that duplicate checks are answered locally after one load"""
+        self.responses = [{'results': [_page('ML Engineer', 'Mercari')], 'has_more': False}]
+
+        self.assertTrue(self.client.check_job_exists(' ml engineer', 'MERCARI'))
+        self.assertFalse(self.client.check_job_exists('ML Engineer', 'Rakuten'))
+        self.assertEqual(self.mock_request.call_count, 1)
+
+    def test_keys_use_job_fingerprint(self):
+        """Test that loaded keys are the same fingerprints the scraper dedups with"""
+        self.responses = [{'results': [_page('ML Engineer (Tokyo)', 'Mercari')], 'has_more': False}]
+
+        self.client.load_existing_keys()
+
+        self.assertEqual(self.client._existing_keys, {job_fingerprint('ML Engineer (Tokyo)', 'Mercari')})
+        self.assertTrue(self.client.check_job_exists('ml engineer - tokyo', 'MERCARI'))
+
+    def test_check_uses_given_fingerprint(self):
+        """Test that a precomputed fingerprint is checked instead of hashing the job again"""
+        self.responses = [{'results': [_page('ML Engineer', 'Mercari')], 'has_more': False}]
+        self.client.load_existing_keys()
+        fingerprint = job_fingerprint('ML Engineer', 'Mercari')
+
+        with patch('notion_client.job_fingerprint') as mock_fingerprint:
+            self.assertTrue(self.client.check_job_exists('ML Engineer', 'Mercari', fingerprint))
+        mock_fingerprint.assert_not_called()
+
+    def test_falls_back_to_query_when_load_fails(self):
+        """Test that a failed load falls back to per-job queries"""
+        self.responses = [None, {'results': [{}]}, {'results': []}]
+
+        self.assertTrue(self.client.check_job_exists('ML Engineer', 'Mercari'))
+        self.assertFalse(self.client.check_job_exists('AI Researcher', 'Mercari'))
+        self.assertEqual(self.mock_request.call_count, 3)
+
+
+class TestActivityLog(unittest.TestCase):
+    """Test cases for the change log entry written once per run"""
+
+    def setUp(self):
+        """Set up a client with a known change log schema"""
+        self.client = NotionClient()
+        self.client._schemas[CHANGE_LOG_DATABASE_ID] = {'Name': 'title', 'Jobs Found': 'number'}
+        self.addCleanup(self.client._pending_logs.clear)  # never posted by the atexit flush
+
+    def test_breakdown_becomes_page_body(self):
+        """Test that per-source lines are bullets in the single queued entry"""
+        self.client.log_scraping_activity("AI Jobs Scraper", 5, 2,
+                                          breakdown=["LinkedIn: 3 found, 1 new (Success)",
+                                                     "Mercari: 2 found, 1 new (Success)"])
+
+        self.assertEqual(len(self.client._pending_logs), 1)
+        payload = self.client._pending_logs[0][0]
+        self.assertEqual(payload['properties']['Jobs Found'], {'number': 5})
+        self.assertEqual([block['bulleted_list_item']['rich_text'][0]['text']['content']
+                          for block in payload['children']],
+                         ["LinkedIn: 3 found, 1 new (Success)", "Mercari: 2 found, 1 new (Success)"])
+
+    def test_no_breakdown_has_no_body(self):
+        """Test that an entry without a breakdown has no children"""
+        self.client.log_scraping_activity("AI Jobs Scraper", 0, 0)
+
+        self.assertNotIn('children', self.client._pending_logs[0][0])
+
+
+class TestSchemaCache(unittest.TestCase):
+    """Test cases for the per-client database schema cache"""
+
+    def test_failed_fetch_is_not_retried_per_job(self):
+        """Test that an unavailable schema is requested once and payloads go out unfiltered"""
+        client = NotionClient()
+        properties = {'Job Title': {'title': []}, 'Company': {'select': {'name': 'Mercari'}}}
+        with patch.object(NotionClient, '_make_request', return_value=None) as mock_request:
+            first = client._fit_to_schema(AI_JOBS_DATABASE_ID, properties, 'Job Title')
+            second = client._fit_to_schema(AI_JOBS_DATABASE_ID, properties, 'Job Title')
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(first, properties)
+        self.assertEqual(second, properties)
+
+
+class TestExitFlush(unittest.TestCase):
+    """Test cases for change log entries left unflushed at exit"""
+
+    def setUp(self):
+        """Set up a client with a known change log schema"""
+        self.client = NotionClient()
+        self.client._schemas[CHANGE_LOG_DATABASE_ID] = {'Name': 'title'}
+        self.addCleanup(self.client._pending_logs.clear)
+
+    def test_exit_hook_posts_without_an_executor(self):
+        """Test that logging without flush_logs() is still written by the exit hook"""
+        self.client.log_scraping_activity("LinkedIn", 3, 1)
+        self.client.log_scraping_activity("Mercari", 2, 1)
+
+        # At interpreter shutdown executors refuse new work
+        with patch('notion_client.ThreadPoolExecutor', side_effect=RuntimeError("shutdown")), \
+                patch.object(NotionClient, '_post_page', return_value={'id': 'page'}) as mock_post:
+            _flush_logs_at_exit(weakref.ref(self.client))
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(self.client._pending_logs, [])
+
+    def test_exit_hook_does_not_keep_client_alive(self):
+        """Test that a discarded client can be collected and its hook does nothing"""
+        client_ref = weakref.ref(NotionClient())
+        gc.collect()
+
+        self.assertIsNone(client_ref())
+        _flush_logs_at_exit(client_ref)
+
+
+class TestRateLimitRetry(unittest.TestCase):
+    """Test cases for retrying Notion requests that hit the rate limit"""
+
+    def setUp(self):
+        """Set up a client whose limiter never sleeps"""
+        self.client = NotionClient()
+        self.client.rate_limiter = Mock()
+
+    def _response(self, status_code, headers=None):
+        """Fake HTTP response"""
+        return Mock(status_code=status_code, headers=headers or {}, content=b'{"ok": true}', text='')
+
+    def test_retries_after_429_using_retry_after(self):
+        """Test that a 429 pauses the shared limiter for Retry-After seconds, then retries"""
+        responses = [self._response(429, {'Retry-After': '2'}), self._response(200)]
+        with patch.object(self.client.session, 'post', side_effect=responses) as mock_post:
+            result = self.client._make_request('POST', 'https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(result, {'ok': True})
+        self.assertEqual(mock_post.call_count, 2)
+        self.client.rate_limiter.pause.assert_called_once_with(2.0)
+
+    def test_backs_off_exponentially_without_header(self):
+        """Test that missing Retry-After falls back to exponential back-off"""
+        responses = [self._response(429), self._response(429), self._response(200)]
+        with patch.object(self.client.session, 'get', side_effect=responses):
+            self.client._make_request('GET', 'https://api.notion.com/v1/users/me')
+
+        delays = [call.args[0] for call in self.client.rate_limiter.pause.call_args_list]
+        self.assertEqual(delays, [0.5, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
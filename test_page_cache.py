@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk page cache
+"""
+
+import tempfile
+import unittest
+from unittest.mock import patch
+from page_cache import PageCache
+
+URL = 'https://www.amazon.jobs/en/search.json?country_code=JP'
+
+
+class TestPageCache(unittest.TestCase):
+    """Test cases for PageCache"""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = PageCache(tmp_dir.name + '/http_cache', ttl=60)
+
+    def test_miss_returns_none(self):
+        """Test that an uncached URL is a miss"""
+        self.assertIsNone(self.cache.get(URL))
+
+    def test_fresh_entry_is_returned(self):
+        """Test that a stored body comes back unchanged within the TTL"""
+        self.cache.put(URL, b'{"hits": []}')
+
+        self.assertEqual(self.cache.get(URL), b'{"hits": []}')
+        self.assertIsNone(self.cache.get(URL + '&page=2'))
+
+    def test_stale_entry_is_a_miss(self):
+        """Test that entries older than the TTL are ignored"""
+        with patch('page_cache.time.time', return_value=1000.0):
+            self.cache.put(URL, b'{}')
+
+        with patch('page_cache.time.time', return_value=1000.0 + 61):
+            self.assertIsNone(self.cache.get(URL))
+
+    def test_validators_come_from_stored_headers(self):
+        """Test that the stored ETag / Last-Modified become conditional request headers"""
+        self.assertEqual(self.cache.validators(URL), {})
+        self.cache.put(URL, b'{}', etag='"abc"', last_modified='Wed, 14 Oct 2026 09:00:00 GMT')
+
+        self.assertEqual(self.cache.validators(URL), {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 14 Oct 2026 09:00:00 GMT',
+        })
+
+    def test_refresh_revives_a_stale_entry(self):
+        """Test that a 304 makes the stored body fresh again"""
+        with patch('page_cache.time.time', return_value=1000.0):
+            self.cache.put(URL, b'{"hits": []}', etag='"abc"')
+
+        with patch('page_cache.time.time', return_value=1000.0 + 61):
+            self.assertEqual(self.cache.refresh(URL), b'{"hits": []}')
+            self.assertEqual(self.cache.get(URL), b'{"hits": []}')
+        self.assertEqual(self.cache.validators(URL), {'If-None-Match': '"abc"'})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
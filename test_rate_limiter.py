@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the rate limiting module
+"""
+
+import unittest
+from unittest.mock import patch
+from rate_limiter import PerHostLimiter, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket"""
+
+    def setUp(self):
+        """Set up a controllable clock"""
+        self.now = 100.0
+        monotonic_patcher = patch('rate_limiter.time.monotonic', side_effect=lambda: self.now)
+        sleep_patcher = patch('rate_limiter.time.sleep', side_effect=self._advance)
+        self.mock_monotonic = monotonic_patcher.start()
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+
+    def _advance(self, seconds):
+        """Fake sleep that moves the clock forward"""
+        self.now += seconds
+
+    def test_burst_does_not_sleep(self):
+        """Test that a full bucket serves a burst without waiting"""
+        bucket = TokenBucket(rate=3, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+        self.mock_sleep.assert_not_called()
+
+    def test_empty_bucket_waits_for_next_token(self):
+        """Test that an empty bucket sleeps only until the next token"""
+        bucket = TokenBucket(rate=2, capacity=1)
+        bucket.acquire()
+
+        wait = bucket.acquire()
+
+        self.assertAlmostEqual(wait, 0.5)
+        self.mock_sleep.assert_called_once()
+
+    def test_idle_time_refills_up_to_capacity(self):
+        """Test that idle time builds credit but never beyond capacity"""
+        bucket = TokenBucket(rate=1, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        self.now += 60
+        waits = [bucket.acquire() for _ in range(2)]
+
+        self.assertEqual(waits, [0.0, 0.0])
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test_sustained_rate(self):
+        """Test that the long-run rate matches the configured rate"""
+        bucket = TokenBucket(rate=2.7, capacity=3)
+        start = self.now
+
+        for _ in range(30):
+            bucket.acquire()
+
+        # First 3 requests ride the burst, the remaining 27 are paced
+        self.assertAlmostEqual(self.now - start, 27 / 2.7, places=6)
+
+    def test_concurrent_callers_queue_for_tokens(self):
+        """Test that callers arriving together reserve successive tokens"""
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.mock_sleep.side_effect = None  # callers overlap, so the clock stays put
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 1.0, 2.0])
+
+    def test_pause_holds_back_next_caller(self):
+        """Test that a pause delays the next acquire by the pause length"""
+        bucket = TokenBucket(rate=3, capacity=3)
+
+        bucket.pause(2.5)
+
+        self.assertAlmostEqual(bucket.acquire(), 2.5)
+
+
+class TestPerHostLimiter(unittest.TestCase):
+    """Test cases for PerHostLimiter"""
+
+    def setUp(self):
+        """Set up a controllable clock"""
+        self.now = 100.0
+        monotonic_patcher = patch('rate_limiter.time.monotonic', side_effect=lambda: self.now)
+        sleep_patcher = patch('rate_limiter.time.sleep', side_effect=self._advance)
+        monotonic_patcher.start()
+        sleep_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+        self.limiter = PerHostLimiter(min_interval=2.0)
+
+    def _advance(self, seconds):
+        """Fake sleep that moves the clock forward"""
+        self.now += seconds
+
+    def test_same_host_is_spaced_out(self):
+        """Test that back-to-back requests to one host wait min_interval"""
+        waits = [self.limiter.acquire('careers.example.com') for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 2.0, 2.0])
+
+    def test_hosts_are_independent(self):
+        """Test that a request to another host does not wait"""
+        self.limiter.acquire('careers.example.com')
+
+        self.assertEqual(self.limiter.acquire('jobs.example.org'), 0.0)
+
+    def test_retry_after_holds_host_back(self):
+        """Test that a 429 with Retry-After delays the host's next request"""
+        self.limiter.acquire('careers.example.com')
+        self.limiter.update('careers.example.com', 429, {'Retry-After': '30'})
+
+        self.assertEqual(self.limiter.acquire('careers.example.com'), 30.0)
+
+    def test_rate_limit_headers_spread_remaining_quota(self):
+        """Test that X-RateLimit headers spread the remaining requests over the window"""
+        self.limiter.acquire('api.example.com')
+        self.limiter.update('api.example.com', 200,
+                            {'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': '20'})
+
+        self.assertEqual(self.limiter.acquire('api.example.com'), 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
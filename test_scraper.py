@@ -5,7 +5,7 @@ Test script for AI Jobs Japan Scraper
 
 import time
 from datetime import datetime
-from scraper import AIJobsScraper
+from scraper import AIJobsScraper, _JOB_BOARDS
 from selenium.webdriver.common.by import By
 
 def test_scraper():
@@ -67,7 +67,7 @@ def test_scraper():
         # Test extracting job data from first card
         print("\n📝 Testing job data extraction...")
         try:
-            job_data = scraper._extract_linkedin_job(job_cards[0])
+            job_data = scraper._extract_board_job(job_cards[0], _JOB_BOARDS['linkedin'])
             if job_data:
                 print(f"✅ Successfully extracted job data:")
                 print(f"   Title: {job_data.get('title', 'N/A')}")
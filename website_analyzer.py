@@ -4,13 +4,29 @@ Website Analyzer for Auto Scraping Type Detection
 Analyzes website structure and determines the best scraping strategy
 """
 
+from __future__ import annotations
+
 import requests
 import re
 import json
 import time
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup  # imported on first analysis, see analyze_website
+
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Class names of job listing cards, matched by BeautifulSoup against each class in C
+_JOB_CLASS_RE = re.compile(
+    r'job[_-]?(?:card|item|listing|post)|(?:position|career|vacancy|role|opening)[_-]?(?:card|item|listing)',
+    re.IGNORECASE)
 
 
 class WebsiteAnalyzer:
@@ -64,7 +80,8 @@ class WebsiteAnalyzer:
             
             # Step 3: Analyze HTML content
             if response.text:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 analysis['javascript_heavy'] = self._analyze_javascript_dependency(soup, response.text)
                 analysis['spa_detected'] = self._detect_spa_patterns(soup, response.text)
                 analysis['job_board_patterns'] = self._detect_job_board_patterns(soup, response.text)
@@ -216,21 +233,9 @@ class WebsiteAnalyzer:
     
     def _detect_job_board_patterns(self, soup: BeautifulSoup, html_content: str) -> bool:
         """Detect common job board HTML patterns"""
-        job_patterns = [
-            r'job[_-]?(?:card|item|listing|post)',
-            r'position[_-]?(?:card|item|listing)',
-            r'career[_-]?(?:card|item|listing)',
-            r'vacancy[_-]?(?:card|item|listing)',
-            r'role[_-]?(?:card|item|listing)',
-            r'opening[_-]?(?:card|item|listing)'
-        ]
-        
-        # Check class names and IDs
-        for element in soup.find_all(['div', 'article', 'section'], class_=True):
-            classes = ' '.join(element.get('class', []))
-            for pattern in job_patterns:
-                if re.search(pattern, classes, re.IGNORECASE):
-                    return True
+        # Check class names - one precompiled pattern, stopping at the first card
+        if soup.find(['div', 'article', 'section'], class_=_JOB_CLASS_RE):
+            return True
                     
         # Check for job-related text content
         job_keywords = ['apply now', 'job title', 'company name', 'location', 'salary', 'full-time', 'part-time']